@@ -0,0 +1,67 @@
+"""Add owners_min to game_metadata
+
+Revision ID: a9e656273eed
+Revises: cdf2c58c0747
+Create Date: 2026-10-16 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e656273eed'
+down_revision: Union[str, Sequence[str], None] = 'cdf2c58c0747'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('game_metadata', sa.Column('owners_min', sa.Integer(), nullable=True))
+
+    # Backfill the lower bound from SteamSpy's "1,000,000 .. 2,000,000" strings;
+    # one UPDATE per distinct estimate since there are only a handful of ranges
+    game_metadata = sa.table(
+        'game_metadata',
+        sa.column('owners_estimate', sa.String),
+        sa.column('owners_min', sa.Integer),
+    )
+    connection = op.get_bind()
+    estimates = connection.execute(
+        sa.select(game_metadata.c.owners_estimate)
+        .where(game_metadata.c.owners_estimate.isnot(None))
+        .distinct()
+    ).scalars().all()
+    for estimate in estimates:
+        try:
+            owners_min = int(estimate.split('..')[0].strip().replace(',', ''))
+        except ValueError:
+            continue
+        connection.execute(
+            game_metadata.update()
+            .where(game_metadata.c.owners_estimate == estimate)
+            .values(owners_min=owners_min)
+        )
+
+    op.create_index(
+        'ix_game_metadata_owners_min',
+        'game_metadata',
+        ['owners_min'],
+        unique=False,
+        postgresql_where=sa.text('owners_min >= 1000000'),
+        sqlite_where=sa.text('owners_min >= 1000000'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_game_metadata_owners_min',
+        table_name='game_metadata',
+        postgresql_where=sa.text('owners_min >= 1000000'),
+        sqlite_where=sa.text('owners_min >= 1000000'),
+    )
+    op.drop_column('game_metadata', 'owners_min')
@@ -0,0 +1,42 @@
+"""Index game_metadata fetch_status and owners_estimate
+
+Revision ID: c65447c32539
+Revises: a9e656273eed
+Create Date: 2026-10-16 14:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c65447c32539'
+down_revision: Union[str, Sequence[str], None] = 'a9e656273eed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_game_metadata_fetch_status'), 'game_metadata', ['fetch_status'], unique=False)
+    op.create_index(
+        'ix_game_metadata_owners_estimate',
+        'game_metadata',
+        ['owners_estimate'],
+        unique=False,
+        postgresql_where=sa.text('owners_estimate IS NOT NULL'),
+        sqlite_where=sa.text('owners_estimate IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_game_metadata_owners_estimate',
+        table_name='game_metadata',
+        postgresql_where=sa.text('owners_estimate IS NOT NULL'),
+        sqlite_where=sa.text('owners_estimate IS NOT NULL'),
+    )
+    op.drop_index(op.f('ix_game_metadata_fetch_status'), table_name='game_metadata')
@@ -40,7 +40,7 @@ def create_app(config_name=None):
     config_class = config.get(config_name, config['default'])
     
     app = Flask(__name__)
-    app.config.from_object(config_class)
+    app.config.from_object(config_class())
     
     # Initialize database
     global SessionLocal
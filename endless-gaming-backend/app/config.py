@@ -26,8 +26,13 @@ class Config:
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
     
     # Steam API settings
-    STEAM_API_KEY = os.environ.get('STEAM_API_KEY')
     STEAM_API_BASE_URL = 'https://api.steampowered.com'
+    STEAM_API_TRANSPORT = None  # httpx transport override, e.g. MockTransport in tests
+    
+    def __init__(self):
+        # Read the API key when the config is instantiated, not when this
+        # module is imported, so it reflects the current environment
+        self.STEAM_API_KEY = os.environ.get('STEAM_API_KEY')
 
 
 class DevelopmentConfig(Config):
@@ -40,6 +45,8 @@ class DevelopmentConfig(Config):
 class TestingConfig(Config):
     """Testing configuration."""
     
+    __test__ = False  # Not a pytest test class despite the name
+    
     TESTING = True
     DATABASE_URL = 'sqlite:///:memory:'
     CACHE_TYPE = 'NullCache'  # Disable caching in tests
@@ -5,13 +5,14 @@ Contains the routes for the discovery API endpoints:
 - GET /games/master.json - Returns all active games with metadata
 """
 from flask import jsonify, current_app
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, contains_eager
 from sqlalchemy.exc import DatabaseError
 
 from app.discovery import bp
 from app.discovery.utils import to_game_record
 from models.game import Game
-from models.game_metadata import GameMetadata
+from models.game_metadata import GameMetadata, parse_owners_min
+from models.storefront_data import StorefrontData
 from app import cache
 
 
@@ -25,21 +26,8 @@ def has_million_plus_owners(owners_estimate: str) -> bool:
     Returns:
         True if the estimate indicates 1M+ owners
     """
-    if not owners_estimate:
-        return False
-    
-    # Ranges that indicate 1M+ owners
-    million_plus_ranges = [
-        "1,000,000 .. 2,000,000",
-        "2,000,000 .. 5,000,000", 
-        "5,000,000 .. 10,000,000",
-        "10,000,000 .. 20,000,000",
-        "20,000,000 .. 50,000,000",
-        "50,000,000 .. 100,000,000",
-        "100,000,000 .. 200,000,000"
-    ]
-    
-    return owners_estimate in million_plus_ranges
+    owners_min = parse_owners_min(owners_estimate)
+    return owners_min is not None and owners_min >= 1_000_000
 
 
 @bp.route('/games/master.json')
@@ -57,32 +45,48 @@ def get_master_json():
         session = current_app.db_session_factory()
         
         try:
-            # Define owner ranges that indicate 1M+ owners
-            million_plus_ranges = [
-                "1,000,000 .. 2,000,000",
-                "2,000,000 .. 5,000,000", 
-                "5,000,000 .. 10,000,000",
-                "10,000,000 .. 20,000,000",
-                "20,000,000 .. 50,000,000",
-                "50,000,000 .. 100,000,000",
-                "100,000,000 .. 200,000,000"
-            ]
-            
             # Query all active games with their metadata, filtered for 1M+ owners
             # Also filter out games without tags since they can't contribute to preference learning
             games = (
                 session.query(Game)
                 .join(Game.game_metadata)
                 .filter(Game.is_active.is_(True))
-                .filter(GameMetadata.owners_estimate.in_(million_plus_ranges))
+                .filter(GameMetadata.owners_min >= 1_000_000)
                 .filter(GameMetadata.tags_json.isnot(None))  # Has tags data
                 .filter(GameMetadata.tags_json != '{}')      # Not empty JSON object
                 .filter(GameMetadata.tags_json != '')       # Not empty string
                 .order_by(GameMetadata.score_rank)
                 .limit(1000)
                 .options(
-                    joinedload(Game.game_metadata),
-                    joinedload(Game.storefront_data)
+                    # Only load the columns to_game_record() reads; reuse the explicit
+                    # metadata join instead of joining game_metadata a second time
+                    contains_eager(Game.game_metadata).load_only(
+                        GameMetadata.developer,
+                        GameMetadata.publisher,
+                        GameMetadata.positive_reviews,
+                        GameMetadata.negative_reviews,
+                        GameMetadata.price,
+                        GameMetadata.genre,
+                        GameMetadata.tags_json
+                    ),
+                    joinedload(Game.storefront_data).load_only(
+                        StorefrontData.short_description,
+                        StorefrontData.detailed_description,
+                        StorefrontData.is_free,
+                        StorefrontData.required_age,
+                        StorefrontData.website,
+                        StorefrontData.header_image,
+                        StorefrontData.release_date,
+                        StorefrontData.developers,
+                        StorefrontData.publishers,
+                        StorefrontData.genres,
+                        StorefrontData.categories,
+                        StorefrontData.supported_languages,
+                        StorefrontData.price_overview,
+                        StorefrontData.pc_requirements,
+                        StorefrontData.screenshots,
+                        StorefrontData.movies
+                    )
                 )
                 .all()
             )
@@ -52,7 +52,8 @@ def lookup_player():
         async def fetch_games():
             async with SteamAPIClient(
                 api_key=steam_api_key,
-                base_url=current_app.config.get('STEAM_API_BASE_URL', 'https://api.steampowered.com')
+                base_url=current_app.config.get('STEAM_API_BASE_URL', 'https://api.steampowered.com'),
+                transport=current_app.config.get('STEAM_API_TRANSPORT')
             ) as client:
                 return await client.get_owned_games(request_schema.player_id)
         
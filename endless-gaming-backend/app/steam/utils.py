@@ -7,6 +7,13 @@ import re
 from typing import Dict, Any
 
 
+# SteamID64 format: 17-digit number starting with 76561198
+STEAM_ID64_PATTERN = re.compile(r'^76561198\d{9}$')
+
+# Vanity name: letters, numbers, underscores, hyphens
+VANITY_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+
 def validate_player_id(player_id: Any) -> bool:
     """
     Validate any player identifier format.
@@ -20,16 +27,14 @@ def validate_player_id(player_id: Any) -> bool:
     if not player_id or not isinstance(player_id, str):
         return False
     
-    # SteamID64 format: 17-digit number starting with 76561198
-    if re.match(r'^76561198\d{9}$', player_id):
+    if STEAM_ID64_PATTERN.match(player_id):
         return True
     
     # Steam profile URL (full or partial)
     if 'steamcommunity.com/id/' in player_id or player_id.startswith('/id/'):
         return True
     
-    # Vanity name: letters, numbers, underscores, hyphens
-    if re.match(r'^[a-zA-Z0-9_-]+$', player_id):
+    if VANITY_NAME_PATTERN.match(player_id):
         return True
     
     return False
@@ -48,9 +53,7 @@ def validate_steam_id(steam_id: Any) -> bool:
     if not steam_id or not isinstance(steam_id, str):
         return False
     
-    # SteamID64 format: 17-digit number starting with 76561198
-    pattern = r'^76561198\d{9}$'
-    return bool(re.match(pattern, steam_id))
+    return bool(STEAM_ID64_PATTERN.match(steam_id))
 
 
 def format_error_response(message: str, status_code: int = 400) -> Dict[str, Any]:
@@ -9,6 +9,7 @@ from sqlalchemy import and_
 
 from models.game import Game
 from models.game_metadata import GameMetadata  # Import to ensure SQLAlchemy relationship works
+from utils.http_client import HTTPClient
 from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
 
 
@@ -21,15 +22,17 @@ class SteamGameListCollector:
     upsert logic for new/updated/deactivated games.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[HTTPClient] = None):
         """
         Initialize Steam game list collector.
         
         Args:
             api_key: Steam Web API key. If not provided, will try to get from environment.
+            http_client: Shared HTTP client to send requests through (a new one
+                is created if not provided)
         """
         self.api_key = api_key or os.getenv('STEAM_API_KEY')
-        self.rate_limiter = SimpleRateLimiter()
+        self.rate_limiter = SimpleRateLimiter(http_client)
         self.logger = logging.getLogger(__name__)
         
     def build_steam_api_url(self) -> str:
@@ -9,7 +9,9 @@ from sqlalchemy.orm import Session
 from models.game import Game
 from models.storefront_data import StorefrontData
 from models.game_metadata import FetchStatus
+from utils.http_client import HTTPClient
 from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
+from utils.response_cache import ResponseCache
 
 
 class SteamStoreCollector:
@@ -21,16 +23,26 @@ class SteamStoreCollector:
     data collection.
     """
     
-    def __init__(self, max_retries: int = 3):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        storefront_cache: Optional[ResponseCache] = None,
+        http_client: Optional[HTTPClient] = None
+    ):
         """
         Initialize Steam Store collector.
         
         Args:
             max_retries: Maximum number of retry attempts for failed requests
+            storefront_cache: Cache of Steam Store appdetails responses (no
+                caching if not provided)
+            http_client: Shared HTTP client to send requests through (a new one
+                is created if not provided)
         """
-        self.rate_limiter = SimpleRateLimiter()
+        self.rate_limiter = SimpleRateLimiter(http_client)
         self.logger = logging.getLogger(__name__)
         self.max_retries = max_retries
+        self.storefront_cache = storefront_cache
         
     def build_steam_store_api_url(self, app_id: int) -> str:
         """
@@ -42,9 +54,7 @@ class SteamStoreCollector:
         Returns:
             Complete API URL for the specific game
         """
-        base_url = "https://store.steampowered.com/api/appdetails"
-        params = f"?appids={app_id}"
-        return base_url + params
+        return f"https://store.steampowered.com/api/appdetails?appids={app_id}"
     
     async def fetch_storefront_data(self, app_id: int) -> StorefrontData:
         """
@@ -61,10 +71,15 @@ class SteamStoreCollector:
         try:
             self.logger.debug(f"Fetching storefront data for app_id {app_id}")
             
-            response_data = await self.rate_limiter.make_request(
-                APIEndpoint.STEAM_STORE_APPDETAILS_API,
-                url
-            )
+            response_data = self.storefront_cache.get(app_id) if self.storefront_cache else None
+            if response_data is None:
+                response_data = await self.rate_limiter.make_request(
+                    APIEndpoint.STEAM_STORE_APPDETAILS_API,
+                    url
+                )
+                # Not-found responses are cached too so they aren't re-requested
+                if self.storefront_cache:
+                    self.storefront_cache.set(app_id, response_data)
             
             # Steam Store API returns data in format: {"app_id": {"success": bool, "data": {...}}}
             app_data = response_data.get(str(app_id))
@@ -199,7 +214,7 @@ class SteamStoreCollector:
         Args:
             games: List of Game objects to fetch storefront data for
             session: Database session
-            batch_size: Number of games to process concurrently (for rate limiting)
+            batch_size: Maximum number of games fetched concurrently
             progress_callback: Optional callback for progress updates
                 Signature: (current, total, game_name, status)
             
@@ -213,26 +228,19 @@ class SteamStoreCollector:
         
         self.logger.info(f"Starting storefront data collection for {total_games} games")
         
-        # Process games in batches for concurrent fetching but save immediately
-        for i in range(0, total_games, batch_size):
-            batch = games[i:i + batch_size]
-            batch_start = i + 1
-            batch_end = min(i + batch_size, total_games)
-            
-            self.logger.info(f"Processing batch {batch_start}-{batch_end} of {total_games}")
-            
-            # Create tasks for concurrent fetching within the batch
-            tasks = []
-            for game in batch:
-                task = self.fetch_storefront_data(game.app_id)
-                tasks.append(task)
-            
-            # Execute batch concurrently (rate limiter handles throttling)
-            batch_storefront_data = await asyncio.gather(*tasks)
-            
-            # Process each game immediately: save to DB and call progress callback
-            for j, storefront_data in enumerate(batch_storefront_data):
-                game = batch[j]  # Get corresponding game
+        # Keep up to batch_size fetches in flight at once (the rate limiter
+        # still throttles the requests); a slow game no longer holds up the
+        # rest of its batch, since each result is handled as it completes
+        semaphore = asyncio.Semaphore(batch_size)
+        
+        async def fetch(game: Game):
+            async with semaphore:
+                return game, await self.fetch_storefront_data(game.app_id)
+        
+        tasks = [asyncio.create_task(fetch(game)) for game in games]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                game, storefront_data = await completed
                 
                 # Save this single game's storefront data immediately
                 await self.save_storefront_data_to_database([storefront_data], session)
@@ -245,18 +253,23 @@ class SteamStoreCollector:
                 else:
                     failed_fetches += 1
                 
+                current = successful_fetches + failed_fetches + not_found
+                
                 # Call progress callback immediately after saving
                 if progress_callback:
-                    current = successful_fetches + failed_fetches + not_found
-                    # Call progress callback with status info
                     progress_callback(current, total_games, game.name, storefront_data.fetch_status)
-            
-            self.logger.info(
-                f"Completed batch {batch_start}-{batch_end}: "
-                f"success={len([s for s in batch_storefront_data if s.fetch_status == FetchStatus.SUCCESS.value])}, "
-                f"failed={len([s for s in batch_storefront_data if s.fetch_status == FetchStatus.FAILED.value])}, "
-                f"not_found={len([s for s in batch_storefront_data if s.fetch_status == FetchStatus.NOT_FOUND.value])}"
-            )
+                
+                if current % batch_size == 0 or current == total_games:
+                    self.logger.info(
+                        f"Processed {current} of {total_games} games: "
+                        f"success={successful_fetches}, failed={failed_fetches}, not_found={not_found}"
+                    )
+        finally:
+            # Don't leave fetches running if saving or a callback failed (or the
+            # caller cancelled us); wait for them so none outlives this call
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         result = {
             'total_games_processed': total_games,
@@ -7,14 +7,20 @@ popularity (owner count), processing them in batches of 1000 games per page.
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional, Callable, Any
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from models.game import Game
 from models.game_metadata import GameMetadata  # Needed for SQLAlchemy relationship resolution
+from utils.http_client import HTTPClient
 from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
 
 
+# Rows per upsert/lookup statement; keeps bound parameters well under the
+# SQLite and PostgreSQL limits
+UPSERT_CHUNK_SIZE = 1000
+
+
 class SteamSpyAllCollector:
     """
     Collector for fetching games from SteamSpy /all endpoint in popularity order.
@@ -24,9 +30,15 @@ class SteamSpyAllCollector:
     1000 games per page with rate limiting of 1 request per minute for /all calls.
     """
     
-    def __init__(self):
-        """Initialize SteamSpy All collector."""
-        self.rate_limiter = SimpleRateLimiter()
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize SteamSpy All collector.
+        
+        Args:
+            http_client: Shared HTTP client to send requests through (a new one
+                is created if not provided)
+        """
+        self.rate_limiter = SimpleRateLimiter(http_client)
         self.logger = logging.getLogger(__name__)
     
     def build_steamspy_all_url(self, page: int) -> str:
@@ -84,8 +96,10 @@ class SteamSpyAllCollector:
             return []
         
         games = []
+        # One timestamp for the whole page rather than two utcnow() calls per game
+        now = datetime.utcnow()
         
-        for app_id_str, game_data in response.items():
+        for game_data in response.values():
             try:
                 # Validate game data structure
                 if not isinstance(game_data, dict):
@@ -104,8 +118,8 @@ class SteamSpyAllCollector:
                     app_id=int(app_id),
                     name=name,
                     is_active=True,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+                    created_at=now,
+                    updated_at=now
                 )
                 
                 games.append(game)
@@ -124,7 +138,7 @@ class SteamSpyAllCollector:
         deactivate_missing: bool = False
     ) -> Dict[str, int]:
         """
-        Save games to database with upsert logic.
+        Save games to database with a bulk INSERT ... ON CONFLICT DO UPDATE.
         
         Args:
             games: List of Game objects to save
@@ -134,43 +148,64 @@ class SteamSpyAllCollector:
         Returns:
             Dictionary with operation counts
         """
-        new_games = 0
-        updated_games = 0
         deactivated_games = 0
+        now = datetime.utcnow()
         
-        # Get current app_ids for deactivation logic
-        current_app_ids = {game.app_id for game in games}
+        # One row per app_id (last occurrence wins): a single upsert statement
+        # may not update the same row twice
+        rows = {
+            game.app_id: {
+                'app_id': game.app_id,
+                'name': game.name,
+                'is_active': True,
+                'created_at': game.created_at or now,
+                'updated_at': now,
+            }
+            for game in games
+        }
+        current_app_ids = list(rows)
         
-        for game in games:
-            try:
-                # Check if game already exists
-                existing = session.query(Game).filter(Game.app_id == game.app_id).first()
-                
-                if existing:
-                    # Update existing game
-                    existing.name = game.name
-                    existing.is_active = True
-                    existing.updated_at = datetime.utcnow()
-                    updated_games += 1
-                else:
-                    # Add new game
-                    session.add(game)
-                    new_games += 1
-                    
-            except IntegrityError as e:
-                self.logger.error(f"Database integrity error for game {game.app_id}: {e}")
-                session.rollback()
-                continue
+        # Count existing games up front so new/updated totals don't need a
+        # per-row lookup (or a dialect-specific RETURNING trick)
+        existing_app_ids = set()
+        for start in range(0, len(current_app_ids), UPSERT_CHUNK_SIZE):
+            chunk = current_app_ids[start:start + UPSERT_CHUNK_SIZE]
+            existing_app_ids.update(
+                session.execute(select(Game.app_id).where(Game.app_id.in_(chunk))).scalars()
+            )
+        updated_games = len(existing_app_ids)
+        new_games = len(rows) - updated_games
+        
+        # Insert new games and update existing ones in bulk statements
+        if session.get_bind().dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        row_values = list(rows.values())
+        for start in range(0, len(row_values), UPSERT_CHUNK_SIZE):
+            stmt = insert(Game).values(row_values[start:start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Game.app_id],
+                set_={
+                    'name': stmt.excluded.name,
+                    'is_active': True,
+                    'updated_at': stmt.excluded.updated_at,
+                }
+            )
+            session.execute(stmt)
         
         # Deactivate missing games if requested
         if deactivate_missing:
-            # Find games not in current response
-            existing_games = session.query(Game).filter(Game.is_active == True).all()
-            for existing_game in existing_games:
-                if existing_game.app_id not in current_app_ids:
-                    existing_game.is_active = False
-                    existing_game.updated_at = datetime.utcnow()
-                    deactivated_games += 1
+            # Every game just upserted has updated_at == now, so anything active
+            # and older wasn't in this batch. One UPDATE, without binding the
+            # (possibly tens of thousands of) current app_ids as NOT IN params.
+            result = session.execute(
+                update(Game)
+                .where(Game.is_active == True, Game.updated_at < now)
+                .values(is_active=False, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            deactivated_games = result.rowcount
         
         # Commit all changes
         session.commit()
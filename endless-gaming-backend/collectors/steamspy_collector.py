@@ -1,6 +1,7 @@
 """
 SteamSpy metadata collector for fetching detailed game metadata.
 """
+import heapq
 import logging
 import asyncio
 from typing import List, Dict, Any, Optional, Callable
@@ -8,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from models.game import Game
 from models.game_metadata import GameMetadata, FetchStatus
+from utils.http_client import HTTPClient
 from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
 
 
@@ -20,14 +22,16 @@ class SteamSpyMetadataCollector:
     data collection (23k+ games).
     """
     
-    def __init__(self, max_retries: int = 3):
+    def __init__(self, max_retries: int = 3, http_client: Optional[HTTPClient] = None):
         """
         Initialize SteamSpy metadata collector.
         
         Args:
             max_retries: Maximum number of retry attempts for failed requests
+            http_client: Shared HTTP client to send requests through (a new one
+                is created if not provided)
         """
-        self.rate_limiter = SimpleRateLimiter()
+        self.rate_limiter = SimpleRateLimiter(http_client)
         self.logger = logging.getLogger(__name__)
         self.max_retries = max_retries
         
@@ -41,9 +45,7 @@ class SteamSpyMetadataCollector:
         Returns:
             Complete API URL for the specific game
         """
-        base_url = "https://steamspy.com/api.php"
-        params = f"?request=appdetails&appid={app_id}"
-        return base_url + params
+        return f"https://steamspy.com/api.php?request=appdetails&appid={app_id}"
     
     async def fetch_game_metadata(self, app_id: int) -> GameMetadata:
         """
@@ -270,9 +272,8 @@ class SteamSpyMetadataCollector:
                     # Extract top 3 tags if available
                     top_tags = []
                     if metadata.tags_json and isinstance(metadata.tags_json, dict):
-                        # Sort tags by vote count (value) and take top 3
-                        sorted_tags = sorted(metadata.tags_json.items(), key=lambda x: x[1], reverse=True)
-                        top_tags = [tag[0] for tag in sorted_tags[:3]]
+                        # Top 3 tags by vote count (value) without sorting the whole dict
+                        top_tags = [tag for tag, _ in heapq.nlargest(3, metadata.tags_json.items(), key=lambda x: x[1])]
                     
                     # Call progress callback with enhanced info
                     progress_callback(current, total_games, game.name, top_tags, metadata.fetch_status)
@@ -3,11 +3,31 @@ GameMetadata model for storing detailed Steam game metadata.
 """
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship, validates
 from models import Base
 
 
+def parse_owners_min(owners_estimate: Optional[str]) -> Optional[int]:
+    """
+    Parse the lower bound of a SteamSpy owners estimate.
+    
+    Args:
+        owners_estimate: String like "1,000,000 .. 2,000,000"
+        
+    Returns:
+        Lower bound as an integer (e.g. 1000000), or None if unparseable
+    """
+    if not owners_estimate:
+        return None
+    
+    try:
+        return int(owners_estimate.split('..')[0].strip().replace(',', ''))
+    except ValueError:
+        return None
+
+
 class FetchStatus(Enum):
     """Enum for tracking metadata fetch status."""
     PENDING = "pending"
@@ -28,6 +48,7 @@ class GameMetadata(Base):
     developer = Column(String)
     publisher = Column(String)
     owners_estimate = Column(String)  # SteamSpy format: "1,000,000 .. 2,000,000"
+    owners_min = Column(Integer)  # Lower bound of owners_estimate, kept in sync on assignment
     positive_reviews = Column(Integer)
     negative_reviews = Column(Integer)
     score_rank = Column(Integer)
@@ -39,7 +60,30 @@ class GameMetadata(Base):
     tags_json = Column(JSON)  # Store tag dictionary
     last_updated = Column(DateTime, default=datetime.utcnow, nullable=False)
     fetch_attempts = Column(Integer, default=0, nullable=False, server_default="0")
-    fetch_status = Column(String, default=FetchStatus.PENDING.value, nullable=False, server_default="pending")
+    fetch_status = Column(String, default=FetchStatus.PENDING.value, nullable=False, server_default="pending", index=True)
     
     # Relationship to game
-    game = relationship("Game", back_populates="game_metadata")
\ No newline at end of file
+    game = relationship("Game", back_populates="game_metadata")
+    
+    __table_args__ = (
+        # Partial index covering the 1M+ owners filter used by master.json
+        Index(
+            "ix_game_metadata_owners_min",
+            "owners_min",
+            postgresql_where=owners_min >= 1_000_000,
+            sqlite_where=owners_min >= 1_000_000,
+        ),
+        # Owner distribution reports group on owners_estimate and skip NULLs
+        Index(
+            "ix_game_metadata_owners_estimate",
+            "owners_estimate",
+            postgresql_where=owners_estimate.isnot(None),
+            sqlite_where=owners_estimate.isnot(None),
+        ),
+    )
+    
+    @validates("owners_estimate")
+    def _sync_owners_min(self, key, owners_estimate):
+        """Keep owners_min in sync with owners_estimate."""
+        self.owners_min = parse_owners_min(owners_estimate)
+        return owners_estimate
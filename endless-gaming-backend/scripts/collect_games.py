@@ -9,6 +9,7 @@ efficient processing of large game datasets.
 import asyncio
 import os
 import sys
+from pathlib import Path
 from typing import Optional
 
 import typer
@@ -29,6 +30,14 @@ from collectors.steamspy_all_collector import SteamSpyAllCollector
 from collectors.steamspy_collector import SteamSpyMetadataCollector
 from collectors.steam_store_collector import SteamStoreCollector
 from workers.parallel_fetcher import ParallelMetadataFetcher
+from utils.http_client import HTTPClient
+from utils.response_cache import ResponseCache
+
+# Steam Store appdetails responses are reused across runs for up to 7 days. The
+# cache file defaults to the backend directory, where generate_master_json_direct.py
+# keeps the same (git-ignored) file.
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent
+STOREFRONT_CACHE_FILE = '.storefront_cache.sqlite'
 
 app = typer.Typer(
     name="collect-games",
@@ -160,105 +169,86 @@ async def collect_metadata_parallel(session, batch_size: int, max_concurrent: in
     return total_processed
 
 
-async def collect_interleaved(session, max_pages=None, batch_size=1000, max_concurrent=3, skip_storefront=False):
+async def collect_interleaved(
+    session,
+    max_pages=None,
+    batch_size=1000,
+    max_concurrent=3,
+    skip_storefront=False,
+    use_cache=True,
+    cache_dir=DEFAULT_CACHE_DIR
+):
     """
     Collect games and metadata in interleaved fashion: page -> metadata -> storefront -> page -> metadata -> storefront.
     
     This approach processes each page of games immediately after fetching it,
-    rather than fetching all pages first then processing metadata.
+    rather than fetching all pages first then processing metadata. Steam Store
+    responses are cached on disk (unless use_cache is False), so a rerun only
+    requests games it has no recent response for.
     """
     console.print("🔄 Starting interleaved collection (page -> metadata -> storefront -> page)")
     
-    collector = SteamSpyAllCollector()
-    steamspy_metadata_collector = SteamSpyMetadataCollector()
-    steam_store_collector = SteamStoreCollector()
-    
-    total_games_processed = 0
-    total_metadata_processed = 0
-    total_storefront_processed = 0
-    
-    page = 0
-    while True:
-        # Check if we've reached max pages
-        if max_pages is not None and page >= max_pages:
-            break
-            
-        console.print(f"\n📄 === Processing Page {page} ===")
+    # One pooled HTTP client for all three collectors, so connections are
+    # reused across pages instead of each collector keeping its own pool
+    http_client = HTTPClient()
+    storefront_cache = (
+        ResponseCache(str(Path(cache_dir) / STOREFRONT_CACHE_FILE))
+        if use_cache and not skip_storefront else None
+    )
+    try:
+        collector = SteamSpyAllCollector(http_client)
+        steamspy_metadata_collector = SteamSpyMetadataCollector(http_client=http_client)
+        steam_store_collector = SteamStoreCollector(
+            storefront_cache=storefront_cache,
+            http_client=http_client
+        )
         
-        if page > 0:
-            console.print("⏰ Waiting for rate limit... fetching next page in ~60 seconds")
+        total_games_processed = 0
+        total_metadata_processed = 0
+        total_storefront_processed = 0
         
-        try:
-            # Fetch single page of games
-            console.print(f"🎮 Fetching page {page} from SteamSpy...")
-            response = await collector.fetch_games_page(page)
-            
-            if not response:
-                console.print("✅ No more games found, collection complete")
-                break
-                
-            # Parse and save games from this page
-            games = collector.parse_all_response(response)
-            if not games:
-                console.print("✅ Empty page received, collection complete")
+        page = 0
+        while True:
+            # Check if we've reached max pages
+            if max_pages is not None and page >= max_pages:
                 break
                 
-            # Save games to database
-            save_result = await collector.save_games_to_database(games, session)
-            games_this_page = len(games)
-            total_games_processed += games_this_page
-            
-            console.print(Panel(
-                f"Games on page {page}: {games_this_page}\n"
-                f"New: {save_result['new_games']}, Updated: {save_result['updated_games']}, Deactivated: {save_result['deactivated_games']}",
-                title=f"Page {page} Results",
-                border_style="blue"
-            ))
+            console.print(f"\n📄 === Processing Page {page} ===")
             
-            # Now collect metadata for games from this page immediately
-            console.print(f"🔄 Collecting metadata for {games_this_page} games from page {page}...")
+            if page > 0:
+                console.print("⏰ Waiting for rate limit... fetching next page in ~60 seconds")
             
-            # Create progress callback for this page
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching metadata...", total=games_this_page)
+            try:
+                # Fetch single page of games
+                console.print(f"🎮 Fetching page {page} from SteamSpy...")
+                response = await collector.fetch_games_page(page)
                 
-                def update_progress(current, total, game_name, top_tags, status):
-                    progress.update(task, completed=current)
+                if not response:
+                    console.print("✅ No more games found, collection complete")
+                    break
                     
-                    # Format game display with top 3 tags
-                    tags_display = ", ".join(top_tags) if top_tags else "No tags"
-                    game_display = f"{game_name} ({tags_display})"
+                # Parse and save games from this page
+                games = collector.parse_all_response(response)
+                if not games:
+                    console.print("✅ Empty page received, collection complete")
+                    break
                     
-                    # Show progress for each game immediately
-                    status_emoji = "✅" if status == "success" else "❌" if status == "failed" else "⚠️"
-                    progress.console.print(f"{status_emoji} {game_display}")
+                # Save games to database
+                save_result = await collector.save_games_to_database(games, session)
+                games_this_page = len(games)
+                total_games_processed += games_this_page
                 
-                # Collect metadata for games from this page
-                metadata_result = await steamspy_metadata_collector.collect_metadata_for_games(
-                    games, session, batch_size=batch_size, progress_callback=update_progress
-                )
+                console.print(Panel(
+                    f"Games on page {page}: {games_this_page}\n"
+                    f"New: {save_result['new_games']}, Updated: {save_result['updated_games']}, Deactivated: {save_result['deactivated_games']}",
+                    title=f"Page {page} Results",
+                    border_style="blue"
+                ))
                 
-                total_metadata_processed += metadata_result['total_games_processed']
-            
-            console.print(Panel(
-                f"Metadata processed: {metadata_result['total_games_processed']}\n"
-                f"Success: {metadata_result['successful_fetches']}, Failed: {metadata_result['failed_fetches']}, Not found: {metadata_result['not_found']}",
-                title=f"Page {page} Metadata Results",
-                border_style="green"
-            ))
-            
-            # Collect Steam Store data if not skipped
-            if not skip_storefront:
-                console.print(f"🏪 Collecting Steam Store data for {games_this_page} games from page {page}...")
-                console.print("⏰ Note: Steam Store API is rate limited to 1 request per second")
+                # Now collect metadata for games from this page immediately
+                console.print(f"🔄 Collecting metadata for {games_this_page} games from page {page}...")
                 
-                # Create progress callback for storefront data
+                # Create progress callback for this page
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -266,42 +256,86 @@ async def collect_interleaved(session, max_pages=None, batch_size=1000, max_conc
                     TaskProgressColumn(),
                     console=console
                 ) as progress:
-                    task = progress.add_task("Fetching storefront data...", total=games_this_page)
+                    task = progress.add_task("Fetching metadata...", total=games_this_page)
                     
-                    def storefront_progress_callback(current, total, game_name, status):
+                    def update_progress(current, total, game_name, top_tags, status):
                         progress.update(task, completed=current)
                         
+                        # Format game display with top 3 tags
+                        tags_display = ", ".join(top_tags) if top_tags else "No tags"
+                        game_display = f"{game_name} ({tags_display})"
+                        
                         # Show progress for each game immediately
                         status_emoji = "✅" if status == "success" else "❌" if status == "failed" else "⚠️"
-                        progress.console.print(f"{status_emoji} {game_name} (storefront)")
+                        progress.console.print(f"{status_emoji} {game_display}")
                     
-                    # Collect storefront data for games from this page
-                    storefront_result = await steam_store_collector.collect_storefront_data_for_games(
-                        games, session, batch_size=10, progress_callback=storefront_progress_callback
+                    # Collect metadata for games from this page
+                    metadata_result = await steamspy_metadata_collector.collect_metadata_for_games(
+                        games, session, batch_size=batch_size, progress_callback=update_progress
                     )
                     
-                    total_storefront_processed += storefront_result['total_games_processed']
+                    total_metadata_processed += metadata_result['total_games_processed']
                 
                 console.print(Panel(
-                    f"Storefront data processed: {storefront_result['total_games_processed']}\n"
-                    f"Success: {storefront_result['successful_fetches']}, Failed: {storefront_result['failed_fetches']}, Not found: {storefront_result['not_found']}",
-                    title=f"Page {page} Storefront Results",
-                    border_style="cyan"
+                    f"Metadata processed: {metadata_result['total_games_processed']}\n"
+                    f"Success: {metadata_result['successful_fetches']}, Failed: {metadata_result['failed_fetches']}, Not found: {metadata_result['not_found']}",
+                    title=f"Page {page} Metadata Results",
+                    border_style="green"
                 ))
-            else:
-                console.print("⏭️  Skipping Steam Store data collection (--skip-storefront enabled)")
-            
-            page += 1
-            
-        except Exception as e:
-            console.print(Panel(
-                f"❌ Failed to process page {page}: {str(e)}",
-                title="Error",
-                border_style="red"
-            ))
-            break
-    
-    return total_games_processed, total_metadata_processed, total_storefront_processed
+                
+                # Collect Steam Store data if not skipped
+                if not skip_storefront:
+                    console.print(f"🏪 Collecting Steam Store data for {games_this_page} games from page {page}...")
+                    console.print("⏰ Note: Steam Store API is rate limited to 1 request per second")
+                    
+                    # Create progress callback for storefront data
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        BarColumn(),
+                        TaskProgressColumn(),
+                        console=console
+                    ) as progress:
+                        task = progress.add_task("Fetching storefront data...", total=games_this_page)
+                        
+                        def storefront_progress_callback(current, total, game_name, status):
+                            progress.update(task, completed=current)
+                            
+                            # Show progress for each game immediately
+                            status_emoji = "✅" if status == "success" else "❌" if status == "failed" else "⚠️"
+                            progress.console.print(f"{status_emoji} {game_name} (storefront)")
+                        
+                        # Collect storefront data for games from this page
+                        storefront_result = await steam_store_collector.collect_storefront_data_for_games(
+                            games, session, batch_size=10, progress_callback=storefront_progress_callback
+                        )
+                        
+                        total_storefront_processed += storefront_result['total_games_processed']
+                    
+                    console.print(Panel(
+                        f"Storefront data processed: {storefront_result['total_games_processed']}\n"
+                        f"Success: {storefront_result['successful_fetches']}, Failed: {storefront_result['failed_fetches']}, Not found: {storefront_result['not_found']}",
+                        title=f"Page {page} Storefront Results",
+                        border_style="cyan"
+                    ))
+                else:
+                    console.print("⏭️  Skipping Steam Store data collection (--skip-storefront enabled)")
+                
+                page += 1
+                
+            except Exception as e:
+                console.print(Panel(
+                    f"❌ Failed to process page {page}: {str(e)}",
+                    title="Error",
+                    border_style="red"
+                ))
+                break
+        
+        return total_games_processed, total_metadata_processed, total_storefront_processed
+    finally:
+        await http_client.close()
+        if storefront_cache:
+            storefront_cache.close()
 
 
 @app.command()
@@ -340,6 +374,11 @@ def collect(
         False,
         "--skip-storefront",
         help="Skip Steam Store data collection (faster collection)"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help=f"Fetch all Steam Store data instead of reusing {STOREFRONT_CACHE_FILE} (kept for 7 days)"
     )
 ):
     """
@@ -363,6 +402,7 @@ def collect(
             f"Max concurrent: {_max_concurrent}\n"
             f"Max pages: {max_pages or 'unlimited'}\n"
             f"Skip storefront: {'Yes' if skip_storefront else 'No'}\n"
+            f"Storefront cache: {'No' if no_cache else 'Yes'}\n"
             f"Database: {settings.database_url}",
             title="Collection Configuration",
             border_style="blue"
@@ -382,7 +422,8 @@ def collect(
             else:
                 # Interleaved mode: page -> metadata -> storefront -> page -> metadata -> storefront
                 total_games, total_metadata, total_storefront = await collect_interleaved(
-                    session, max_pages=max_pages, batch_size=_batch_size, max_concurrent=_max_concurrent, skip_storefront=skip_storefront
+                    session, max_pages=max_pages, batch_size=_batch_size, max_concurrent=_max_concurrent,
+                    skip_storefront=skip_storefront, use_cache=not no_cache
                 )
             
             console.print(Panel(
@@ -15,7 +15,8 @@ import sys
 import json
 import argparse
 from pathlib import Path
-from sqlalchemy.orm import joinedload
+import orjson
+from sqlalchemy.orm import joinedload, contains_eager
 from sqlalchemy.exc import DatabaseError
 
 # Add the parent directory to Python path to import modules
@@ -115,32 +116,48 @@ def get_master_json_data(session):
     Returns:
         List of game records for games with 1M+ owners and valid tags
     """
-    # Define owner ranges that indicate 1M+ owners
-    million_plus_ranges = [
-        "1,000,000 .. 2,000,000",
-        "2,000,000 .. 5,000,000", 
-        "5,000,000 .. 10,000,000",
-        "10,000,000 .. 20,000,000",
-        "20,000,000 .. 50,000,000",
-        "50,000,000 .. 100,000,000",
-        "100,000,000 .. 200,000,000"
-    ]
-    
     # Query all active games with their metadata, filtered for 1M+ owners
     # Also filter out games without tags since they can't contribute to preference learning
     games = (
         session.query(Game)
         .join(Game.game_metadata)
         .filter(Game.is_active.is_(True))
-        .filter(GameMetadata.owners_estimate.in_(million_plus_ranges))
+        .filter(GameMetadata.owners_min >= 1_000_000)
         .filter(GameMetadata.tags_json.isnot(None))  # Has tags data
         .filter(GameMetadata.tags_json != '{}')      # Not empty JSON object
         .filter(GameMetadata.tags_json != '')       # Not empty string
         .order_by(GameMetadata.score_rank)
         .limit(1000)
         .options(
-            joinedload(Game.game_metadata),
-            joinedload(Game.storefront_data)
+            # Only load the columns to_game_record() reads; reuse the explicit
+            # metadata join instead of joining game_metadata a second time
+            contains_eager(Game.game_metadata).load_only(
+                GameMetadata.developer,
+                GameMetadata.publisher,
+                GameMetadata.positive_reviews,
+                GameMetadata.negative_reviews,
+                GameMetadata.price,
+                GameMetadata.genre,
+                GameMetadata.tags_json
+            ),
+            joinedload(Game.storefront_data).load_only(
+                StorefrontData.short_description,
+                StorefrontData.detailed_description,
+                StorefrontData.is_free,
+                StorefrontData.required_age,
+                StorefrontData.website,
+                StorefrontData.header_image,
+                StorefrontData.release_date,
+                StorefrontData.developers,
+                StorefrontData.publishers,
+                StorefrontData.genres,
+                StorefrontData.categories,
+                StorefrontData.supported_languages,
+                StorefrontData.price_overview,
+                StorefrontData.pc_requirements,
+                StorefrontData.screenshots,
+                StorefrontData.movies
+            )
         )
         .all()
     )
@@ -156,12 +173,13 @@ def get_master_json_data(session):
     return game_records
 
 
-def export_master_json(output_path: str):
+def export_master_json(output_path: str, pretty: bool = False):
     """
     Export master.json data to the specified file path.
     
     Args:
         output_path: Path where the JSON file should be written
+        pretty: Indent the output for human inspection (default: compact)
     """
     # Get configuration and create database session
     engine = create_engine(settings.database_url)
@@ -180,8 +198,9 @@ def export_master_json(output_path: str):
         
         # Write to file
         print(f"Writing to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(game_records, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes directly, so the whole file is one write
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        output_file.write_bytes(orjson.dumps(game_records, option=option))
         
         print(f"Successfully exported {len(game_records)} games to {output_path}")
         
@@ -203,15 +222,21 @@ def main():
 Examples:
   poetry run python scripts/export_master_json.py ../endless-gaming-frontend/src/assets/master.json
   poetry run python scripts/export_master_json.py /tmp/master.json
+  poetry run python scripts/export_master_json.py /tmp/master.json --pretty
         """
     )
     parser.add_argument(
         'output_path',
         help='Path where the JSON file should be written'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Write indented JSON for debugging (default: compact output)'
+    )
     
     args = parser.parse_args()
-    export_master_json(args.output_path)
+    export_master_json(args.output_path, args.pretty)
 
 
 if __name__ == '__main__':
@@ -13,18 +13,32 @@ Example:
     poetry run python scripts/generate_master_json_direct.py master.json --max-pages 15
 """
 import sys
-import json
+import heapq
 import asyncio
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
+import orjson
+
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
+from utils.http_client import HTTPClient
+from utils.rate_limiter import AdaptiveConcurrency, SimpleRateLimiter, APIEndpoint, is_rate_limited
+from utils.response_cache import ResponseCache
+
+# Number of completed records between progress lines
+PROGRESS_INTERVAL = 50
+
+# SteamSpy and Steam Store appdetails responses are reused across runs for up
+# to 7 days. The cache files default to the backend directory (not the working
+# directory) and are git-ignored.
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent
+METADATA_CACHE_FILE = '.steamspy_cache.sqlite'
+STOREFRONT_CACHE_FILE = '.storefront_cache.sqlite'
 
 
 class DirectGameDataCollector:
@@ -35,11 +49,62 @@ class DirectGameDataCollector:
     without requiring database storage.
     """
     
-    def __init__(self):
-        """Initialize direct collector."""
-        self.rate_limiter = SimpleRateLimiter()
+    def __init__(
+        self,
+        http_client: Optional[HTTPClient] = None,
+        metadata_cache: Optional[ResponseCache] = None,
+        storefront_cache: Optional[ResponseCache] = None
+    ):
+        """
+        Initialize direct collector.
+        
+        Args:
+            http_client: Shared HTTP client for every API request (a new one is
+                created if not provided)
+            metadata_cache: Cache of SteamSpy metadata responses (no caching if
+                not provided)
+            storefront_cache: Cache of Steam Store appdetails responses (no
+                caching if not provided)
+        """
+        self.rate_limiter = SimpleRateLimiter(http_client)
+        self.metadata_cache = metadata_cache
+        self.storefront_cache = storefront_cache
+        # Limits concurrent detail fetches during collect_game_data
+        self.concurrency: Optional[AdaptiveConcurrency] = None
         self.logger = logging.getLogger(__name__)
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def close(self):
+        """Close the pooled HTTP connections and the response caches."""
+        await self.rate_limiter.close()
+        if self.metadata_cache:
+            self.metadata_cache.close()
+        if self.storefront_cache:
+            self.storefront_cache.close()
+        
+    def record_request_result(self, error: Optional[Exception] = None) -> None:
+        """
+        Feed a detail request's outcome into the adaptive concurrency limit.
+        
+        Args:
+            error: Exception raised by the request, or None if it succeeded
+        """
+        if not self.concurrency:
+            return
         
+        if error is None:
+            self.concurrency.record_success()
+        elif is_rate_limited(error):
+            self.concurrency.record_rate_limited()
+            self.logger.warning(f"Rate limited (429), reducing concurrency to {self.concurrency.limit}")
+    
     async def fetch_games_page(self, page: int) -> Dict[str, Any]:
         """
         Fetch a single page of games from SteamSpy /all endpoint.
@@ -77,9 +142,15 @@ class DirectGameDataCollector:
         url = f"https://steamspy.com/api.php?request=appdetails&appid={app_id}"
         
         try:
-            response_data = await self.rate_limiter.make_request(
-                APIEndpoint.STEAMSPY_API, url
-            )
+            response_data = self.metadata_cache.get(app_id) if self.metadata_cache else None
+            if response_data is None:
+                response_data = await self.rate_limiter.make_request(
+                    APIEndpoint.STEAMSPY_API, url
+                )
+                self.record_request_result()
+                # Not-found responses are cached too so they aren't re-requested
+                if self.metadata_cache:
+                    self.metadata_cache.set(app_id, response_data)
             
             # Check if game was found (SteamSpy returns empty dict for not found)
             if not response_data or not response_data.get('appid'):
@@ -88,6 +159,7 @@ class DirectGameDataCollector:
             return response_data
             
         except Exception as e:
+            self.record_request_result(e)
             self.logger.warning(f"Failed to fetch metadata for app_id {app_id}: {e}")
             return None
     
@@ -104,9 +176,15 @@ class DirectGameDataCollector:
         url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
         
         try:
-            response_data = await self.rate_limiter.make_request(
-                APIEndpoint.STEAM_STORE_APPDETAILS_API, url
-            )
+            response_data = self.storefront_cache.get(app_id) if self.storefront_cache else None
+            if response_data is None:
+                response_data = await self.rate_limiter.make_request(
+                    APIEndpoint.STEAM_STORE_APPDETAILS_API, url
+                )
+                self.record_request_result()
+                # Not-found responses are cached too so they aren't re-requested
+                if self.storefront_cache:
+                    self.storefront_cache.set(app_id, response_data)
             
             # Steam Store API returns data in format: {"app_id": {"success": bool, "data": {...}}}
             app_data = response_data.get(str(app_id))
@@ -116,9 +194,42 @@ class DirectGameDataCollector:
             return app_data.get('data', {})
             
         except Exception as e:
+            self.record_request_result(e)
             self.logger.warning(f"Failed to fetch storefront data for app_id {app_id}: {e}")
             return None
     
+    async def fetch_game_details(
+        self,
+        app_id: int,
+        skip_storefront: bool = False
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Fetch metadata and storefront data for one game.
+        
+        Args:
+            app_id: Steam application ID
+            skip_storefront: Skip the Steam Store request
+            
+        Returns:
+            Tuple of (metadata, storefront data); failed fetches are None
+        """
+        # The two APIs have independent rate limits so neither request waits on the other
+        if skip_storefront:
+            return await self.fetch_game_metadata(app_id), None
+        
+        metadata, storefront_data = await asyncio.gather(
+            self.fetch_game_metadata(app_id),
+            self.fetch_storefront_data(app_id),
+            return_exceptions=True
+        )
+        
+        # A failed fetch only drops that game's data, not the whole run
+        if isinstance(metadata, Exception):
+            metadata = None
+        if isinstance(storefront_data, Exception):
+            storefront_data = None
+        return metadata, storefront_data
+    
     def convert_price(self, price_cents: Any) -> Optional[str]:
         """
         Convert price from cents to dollar string format.
@@ -161,58 +272,57 @@ class DirectGameDataCollector:
         if not app_id or not name:
             return None
         
+        # Skip games without tags (can't contribute to preference learning); checked
+        # before any other conversion since many games are dropped here
+        tags = metadata.get('tags') if metadata else None
+        if not tags or not isinstance(tags, dict):
+            return None
+        
         # Use metadata if available, otherwise basic data
         data_source = metadata if metadata else basic_game_data
+        developer = data_source.get('developer')
+        publisher = data_source.get('publisher')
         
         # Convert price format
         price = self.convert_price(data_source.get('price'))
         
-        # Handle tags - ensure we have a dictionary with meaningful content
-        tags = {}
-        if metadata and metadata.get('tags'):
-            if isinstance(metadata['tags'], dict):
-                tags = metadata['tags']
-        
-        # Skip games without tags (can't contribute to preference learning)
-        if not tags or len(tags) == 0:
-            return None
-        
         # Handle genres - convert single genre string to list
         genres = []
         if data_source.get('genre'):
             genre = data_source['genre']
             genres = [genre] if isinstance(genre, str) else genre
         
+        # Steam Store fields are looked up once each; missing storefront data reads as None
+        store = storefront_data or {}
+        
         # Extract release date from storefront data
-        release_date = None
-        if storefront_data and storefront_data.get('release_date') and storefront_data['release_date'].get('date'):
-            release_date = storefront_data['release_date']['date']
+        release_date = (store.get('release_date') or {}).get('date') or None
         
         # Build camelCase record (matching frontend expectations) with ALL available fields
         record = {
             "appId": int(app_id),
             "name": name,
             # Steam Store API fields
-            "coverUrl": storefront_data.get('header_image') if storefront_data else None,
-            "shortDescription": storefront_data.get('short_description') if storefront_data else None,
-            "detailedDescription": storefront_data.get('detailed_description') if storefront_data else None,
-            "isFree": storefront_data.get('is_free') if storefront_data else None,
-            "requiredAge": storefront_data.get('required_age') if storefront_data else None,
-            "website": storefront_data.get('website') if storefront_data else None,
+            "coverUrl": store.get('header_image'),
+            "shortDescription": store.get('short_description'),
+            "detailedDescription": store.get('detailed_description'),
+            "isFree": store.get('is_free'),
+            "requiredAge": store.get('required_age'),
+            "website": store.get('website'),
             "releaseDate": release_date,
-            "developers": storefront_data.get('developers') if storefront_data else [data_source.get('developer')] if data_source.get('developer') else None,
-            "publishers": storefront_data.get('publishers') if storefront_data else [data_source.get('publisher')] if data_source.get('publisher') else None,
-            "storeGenres": storefront_data.get('genres') if storefront_data else None,
-            "categories": storefront_data.get('categories') if storefront_data else None,
-            "supportedLanguages": storefront_data.get('supported_languages') if storefront_data else None,
-            "priceData": storefront_data.get('price_overview') if storefront_data else None,
-            "pcRequirements": storefront_data.get('pc_requirements') if storefront_data else None,
-            "screenshots": storefront_data.get('screenshots') if storefront_data else None,
-            "movies": storefront_data.get('movies') if storefront_data else None,
+            "developers": store.get('developers') if storefront_data else [developer] if developer else None,
+            "publishers": store.get('publishers') if storefront_data else [publisher] if publisher else None,
+            "storeGenres": store.get('genres'),
+            "categories": store.get('categories'),
+            "supportedLanguages": store.get('supported_languages'),
+            "priceData": store.get('price_overview'),
+            "pcRequirements": store.get('pc_requirements'),
+            "screenshots": store.get('screenshots'),
+            "movies": store.get('movies'),
             # SteamSpy fields (preserved)
             "price": price,
-            "developer": data_source.get('developer'),  # Keep for backwards compatibility
-            "publisher": data_source.get('publisher'),  # Keep for backwards compatibility
+            "developer": developer,  # Keep for backwards compatibility
+            "publisher": publisher,  # Keep for backwards compatibility
             "tags": tags,
             "genres": genres,  # SteamSpy genres (different from Steam Store genres)
             "reviewPos": data_source.get('positive'),
@@ -222,31 +332,26 @@ class DirectGameDataCollector:
         return record
     
     
-    async def collect_game_data(
-        self, 
+    async def iter_new_games(
+        self,
         max_pages: Optional[int] = None,
-        batch_size: int = 50,
-        max_games: int = 1000,
-        skip_storefront: bool = False
-    ) -> List[Dict[str, Any]]:
+        max_games: int = 1000
+    ) -> AsyncIterator[List[Tuple[int, Dict[str, Any]]]]:
         """
-        Collect complete game data directly from APIs.
+        Yield the games from each /all page as soon as the page arrives.
         
         Args:
             max_pages: Maximum number of pages to fetch from /all endpoint
-            batch_size: Number of concurrent metadata requests
-            max_games: Maximum number of games to include in final output
-            skip_storefront: Skip Steam Store data collection (faster)
+            max_games: Stop fetching pages once this many games have been seen
             
-        Returns:
-            List of complete game records ready for JSON export
+        Yields:
+            (app_id, basic game data) pairs not seen on an earlier page, in
+            popularity order
         """
-        self.logger.info("Starting direct game data collection")
-        
-        all_games = []
+        # Integer app_ids already yielded, so games repeated across pages are fetched once
+        seen: Set[int] = set()
         page = 0
         
-        # Step 1: Collect basic game data from /all endpoint
         while True:
             if max_pages is not None and page >= max_pages:
                 break
@@ -263,98 +368,177 @@ class DirectGameDataCollector:
                     self.logger.info(f"No more data at page {page}, stopping collection")
                     break
                 
-                # Convert to list and take all games from this page
-                page_games = list(games_data.values())
-                self.logger.info(f"Page {page}: {len(page_games)} games fetched")
+                self.logger.info(f"Page {page}: {len(games_data)} games fetched")
                 
-                all_games.extend(page_games)
+                new_games = []
+                for game_data in games_data.values():
+                    app_id = game_data.get('appid')
+                    if app_id and int(app_id) not in seen:
+                        seen.add(int(app_id))
+                        new_games.append((int(app_id), game_data))
                 page += 1
                 
-                # Stop if we have enough games
-                if len(all_games) >= max_games:
-                    self.logger.info(f"Reached max games limit ({max_games}), stopping collection")
-                    all_games = all_games[:max_games]
-                    break
-                    
             except Exception as e:
                 self.logger.error(f"Error fetching page {page}: {e}")
                 break
+            
+            yield new_games
+            
+            # Stop if we have enough games
+            if len(seen) >= max_games:
+                self.logger.info(f"Reached max games limit ({max_games}), stopping collection")
+                break
         
-        self.logger.info(f"Collected {len(all_games)} games from {page} pages")
+        self.logger.info(f"Collected {len(seen)} games from {page} pages")
+    
+    async def collect_game_data(
+        self, 
+        max_pages: Optional[int] = None,
+        batch_size: int = 50,
+        max_games: int = 1000,
+        skip_storefront: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Collect complete game data directly from APIs.
         
-        # Step 2: Fetch detailed metadata and storefront data for each game
-        self.logger.info("Starting metadata and storefront data collection...")
-        complete_records = []
+        Records are yielded as soon as they're complete, in SteamSpy /all
+        popularity order, so callers can write them out without holding the
+        whole result in memory.
         
-        for i in range(0, len(all_games), batch_size):
-            batch = all_games[i:i + batch_size]
-            batch_start = i + 1
-            batch_end = min(i + batch_size, len(all_games))
-            
-            print(f"📊 Processing batch {batch_start}-{batch_end} of {len(all_games)}")
-            
-            # Create tasks for concurrent metadata and storefront data fetching
-            metadata_tasks = []
-            storefront_tasks = []
-            
-            for game_data in batch:
-                app_id = game_data.get('appid')
-                if app_id:
-                    # Metadata task (SteamSpy)
-                    metadata_task = self.fetch_game_metadata(int(app_id))
-                    metadata_tasks.append((game_data, metadata_task))
-                    
-                    # Storefront data task (Steam Store API) - if not skipped
-                    if not skip_storefront:
-                        storefront_task = self.fetch_storefront_data(int(app_id))
-                        storefront_tasks.append((game_data, storefront_task))
-                    else:
-                        storefront_tasks.append((game_data, None))
-            
-            # Execute metadata batch concurrently
-            print(f"🔄 Fetching SteamSpy metadata for {len(metadata_tasks)} games...")
-            metadata_results = await asyncio.gather(*[task for _, task in metadata_tasks])
-            
-            # Execute storefront data batch concurrently (if not skipped)
-            storefront_results = []
-            if not skip_storefront:
-                print(f"🏪 Fetching Steam Store data for {len(storefront_tasks)} games...")
-                print("⏰ Note: Steam Store API is rate limited to 1 request per second")
-                storefront_results = await asyncio.gather(*[task for _, task in storefront_tasks if task is not None])
-            else:
-                storefront_results = [None] * len(metadata_results)
+        Args:
+            max_pages: Maximum number of pages to fetch from /all endpoint
+            batch_size: Number of concurrent metadata requests
+            max_games: Maximum number of games to include in final output
+            skip_storefront: Skip Steam Store data collection (faster)
             
-            # Process results and build complete records
-            for (basic_data, _), metadata, storefront_data in zip(metadata_tasks, metadata_results, storefront_results):
-                record = self.to_game_record(basic_data, metadata, storefront_data)
+        Yields:
+            Complete game records ready for JSON export
+        """
+        self.logger.info("Starting direct game data collection")
+        
+        # Basic data for every game seen so far, in popularity order. Games past
+        # max_games are fallbacks for ones without metadata or tags.
+        all_games: List[Dict[str, Any]] = []
+        
+        # Games waiting for a worker as (index, app_id). Bounded so page fetching
+        # only runs a few batches ahead of the workers.
+        pending: asyncio.Queue = asyncio.Queue(maxsize=batch_size * 4)
+        # Fetched (index, metadata, storefront data); None marks a worker exiting
+        done: asyncio.Queue = asyncio.Queue()
+        
+        async def produce_games():
+            # Queue each page's games while later pages are still waiting on the
+            # 1/minute /all rate limit
+            async for page_games in self.iter_new_games(max_pages, max_games):
+                for app_id, game_data in page_games:
+                    all_games.append(game_data)
+                    await pending.put((len(all_games) - 1, app_id))
+            for _ in range(batch_size):
+                await pending.put(None)
+        
+        # batch_size workers, of which at most concurrency.limit fetch at once; the
+        # limit halves on 429 responses and creeps back up after runs of successes
+        self.concurrency = AdaptiveConcurrency(batch_size)
+        
+        async def fetch_games():
+            # Workers take games in queue order, i.e. popularity order
+            while (item := await pending.get()) is not None:
+                index, app_id = item
+                async with self.concurrency:
+                    details = await self.fetch_game_details(app_id, skip_storefront)
+                done.put_nowait((index, *details))
+        
+        print(f"🔄 Fetching SteamSpy metadata for up to {max_games} games ({batch_size} at a time) as pages arrive...")
+        if not skip_storefront:
+            print("🏪 Fetching Steam Store data alongside...")
+            print("⏰ Note: Steam Store API is rate limited to 1 request per second")
+        
+        producer = asyncio.create_task(produce_games())
+        workers = [asyncio.create_task(fetch_games()) for _ in range(batch_size)]
+        for worker in workers:
+            worker.add_done_callback(lambda _: done.put_nowait(None))
+        
+        collected = 0
+        # Finished games waiting for earlier ones, so records keep popularity order
+        finished: Dict[int, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+        next_index = 0
+        running_workers = len(workers)
+        
+        try:
+            while running_workers and collected < max_games:
+                result = await done.get()
+                if result is None:
+                    running_workers -= 1
+                    continue
                 
-                if record:
-                    complete_records.append(record)
-                    
-                    # Show progress with game name and top tags
-                    top_tags = []
-                    if record.get('tags'):
-                        sorted_tags = sorted(record['tags'].items(), key=lambda x: x[1], reverse=True)
-                        top_tags = [tag[0] for tag in sorted_tags[:3]]
+                index, metadata, storefront_data = result
+                finished[index] = (metadata, storefront_data)
+                
+                while next_index in finished and collected < max_games:
+                    metadata, storefront_data = finished.pop(next_index)
+                    record = self.to_game_record(all_games[next_index], metadata, storefront_data)
+                    next_index += 1
                     
-                    tags_display = ", ".join(top_tags) if top_tags else "No tags"
-                    storefront_status = " + storefront" if storefront_data else ""
-                    print(f"✅ {record['name']} ({tags_display}){storefront_status}")
+                    if not record:
+                        continue
+                    collected += 1
+
+                    # Report progress periodically rather than once per game
+                    if collected % PROGRESS_INTERVAL == 0:
+                        print(f"✅ {collected}/{max_games} games collected")
+
+                    # Per-game detail (name and top tags) only when running verbose
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        top_tags = heapq.nlargest(3, record['tags'].items(), key=lambda x: x[1])
+                        tags_display = ", ".join(tag for tag, _ in top_tags)
+                        storefront_status = " + storefront" if storefront_data else ""
+                        self.logger.debug(f"✅ {record['name']} ({tags_display}){storefront_status}")
                     
-                    # Exit early if we've reached max_games limit
-                    if len(complete_records) >= max_games:
-                        self.logger.info(f"Reached max_games limit ({max_games}), stopping data collection")
-                        break
+                    yield record
             
-            # Break out of outer batch loop if we've reached the limit
-            if len(complete_records) >= max_games:
-                break
+            if collected >= max_games:
+                self.logger.info(f"Reached max_games limit ({max_games}), stopping data collection")
+        finally:
+            # Cancel page and detail fetches no longer needed (or interrupted)
+            # instead of spending rate limit on them
+            for task in (producer, *workers):
+                task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
         
-        self.logger.info(f"Generated {len(complete_records)} complete game records")
+        self.logger.info(f"Generated {collected} complete game records")
+
+
+async def write_json_array(
+    path: Path,
+    records: AsyncIterator[Dict[str, Any]],
+    pretty: bool = False
+) -> int:
+    """
+    Write records to a file as a JSON array, one record at a time.
+    
+    Args:
+        path: File to write
+        records: Records to write, in output order
+        pretty: Indent the output for human inspection (default: compact)
         
-        # Step 3: Sort by popularity (score_rank if available, otherwise by owners estimate)
-        # SteamSpy /all already returns in popularity order, so maintain that order
-        return complete_records[:max_games]
+    Returns:
+        Number of records written
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        async for record in records:
+            if count:
+                f.write(b',')
+            if pretty:
+                # Nest each indented record one level inside the array; orjson
+                # escapes newlines inside strings, so only layout newlines match
+                f.write(b'\n  ' + orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            else:
+                f.write(orjson.dumps(record))
+            count += 1
+        f.write(b'\n]' if pretty and count else b']')
+    return count
 
 
 async def generate_master_json(
@@ -362,7 +546,11 @@ async def generate_master_json(
     max_pages: Optional[int] = None,
     batch_size: int = 50,
     max_games: int = 1000,
-    skip_storefront: bool = False
+    skip_storefront: bool = False,
+    pretty: bool = False,
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_dir: Path = DEFAULT_CACHE_DIR
 ):
     """
     Generate master.json file directly from APIs.
@@ -373,20 +561,39 @@ async def generate_master_json(
         batch_size: Concurrent requests for metadata
         max_games: Maximum games in output
         skip_storefront: Skip Steam Store data collection (faster)
+        pretty: Indent the output for human inspection (default: compact)
+        verbose: Log every collected game with its top tags
+        use_cache: Reuse SteamSpy metadata and Steam Store data cached by
+            previous runs
+        cache_dir: Directory holding the response cache files
     """
     # Set up logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+    if verbose:
+        logging.getLogger(__name__).setLevel(logging.DEBUG)
     
-    collector = DirectGameDataCollector()
+    cache_dir = Path(cache_dir)
+    if use_cache:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    metadata_cache = ResponseCache(str(cache_dir / METADATA_CACHE_FILE)) if use_cache else None
+    storefront_cache = (
+        ResponseCache(str(cache_dir / STOREFRONT_CACHE_FILE))
+        if use_cache and not skip_storefront else None
+    )
+    collector = DirectGameDataCollector(
+        metadata_cache=metadata_cache,
+        storefront_cache=storefront_cache
+    )
     
+    game_records = None
     try:
         # Collect game data
         storefront_msg = " (skip storefront)" if skip_storefront else " + storefront data"
         print(f"🎮 Starting direct collection (max_pages={max_pages}, max_games={max_games}){storefront_msg}")
-        game_records = await collector.collect_game_data(
+        game_records = collector.collect_game_data(
             max_pages=max_pages,
             batch_size=batch_size,
             max_games=max_games,
@@ -397,23 +604,39 @@ async def generate_master_json(
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write to file
-        print(f"💾 Writing {len(game_records)} games to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(game_records, f, indent=2, ensure_ascii=False)
+        # Write records as they're collected so memory doesn't grow with
+        # max_games. They go to a temporary file first so a failed run doesn't
+        # leave a truncated master.json behind.
+        print(f"💾 Writing games to {output_path} as they're collected...")
+        partial_file = output_file.with_name(output_file.name + '.partial')
+        try:
+            game_count = await write_json_array(partial_file, game_records, pretty)
+        except BaseException:
+            # Failed or interrupted (Ctrl+C cancels the run): drop the partial file
+            # once collection has stopped
+            await game_records.aclose()
+            partial_file.unlink(missing_ok=True)
+            raise
+        partial_file.replace(output_file)
         
         # Calculate file size
         file_size = output_file.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
         
         print(f"✅ Successfully generated master.json")
-        print(f"📊 Games: {len(game_records)}")
+        print(f"📊 Games: {game_count}")
         print(f"📁 Size: {file_size_mb:.1f} MB")
         print(f"📍 Path: {output_path}")
         
     except Exception as e:
         print(f"❌ Error generating master.json: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Stop collection's page and detail fetches before closing the HTTP
+        # client they use
+        if game_records is not None:
+            await game_records.aclose()
+        await collector.close()
 
 
 def main():
@@ -460,6 +683,30 @@ Examples:
         action='store_true',
         help='Skip Steam Store data collection for faster processing'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Write indented JSON for debugging (default: compact output)'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log every collected game with its top tags'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=(
+            f'Fetch all SteamSpy metadata and Steam Store data instead of reusing '
+            f'{METADATA_CACHE_FILE} and {STOREFRONT_CACHE_FILE} (kept for 7 days)'
+        )
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help='Directory for the response cache files (default: the backend directory)'
+    )
     
     args = parser.parse_args()
     
@@ -469,7 +716,11 @@ Examples:
         args.max_pages,
         args.batch_size,
         args.max_games,
-        args.skip_storefront
+        args.skip_storefront,
+        args.pretty,
+        args.verbose,
+        not args.no_cache,
+        args.cache_dir
     ))
 
 
@@ -15,7 +15,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from sqlalchemy import create_engine, func, text
+from sqlalchemy import case, create_engine, func, text
 from sqlalchemy.orm import sessionmaker
 
 # Add project root to path for imports
@@ -34,18 +34,34 @@ app = typer.Typer(
 console = Console()
 
 
+# Shared by every command run in this process, so repeated commands reuse one
+# connection pool and only validate the database once
+_engine = None
+_database_validated = False
+
+
+def get_engine():
+    """Get the shared database engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.database_url)
+    return _engine
+
+
 def create_db_session():
     """Create database session."""
-    engine = create_engine(settings.database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
     return SessionLocal()
 
 
 def validate_database():
     """Validate database connection and tables exist."""
+    global _database_validated
+    if _database_validated:
+        return
+    
     try:
-        engine = create_engine(settings.database_url)
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
             
         # Check if tables exist
@@ -62,6 +78,7 @@ def validate_database():
         ))
         raise typer.Exit(1)
     
+    _database_validated = True
     console.print("✅ Database connection validated")
 
 
@@ -209,13 +226,10 @@ def top_games(
         )
         
         if sort_by == "owners":
-            # For owners, we'll need to sort by the string ranges
-            # This is a simplified sort - in practice you might want to convert to numbers
-            query = query.filter(GameMetadata.owners_estimate.isnot(None))
-            results = query.all()
-            # Sort by extracting the upper bound of the range
-            results = sorted(results, key=lambda x: extract_upper_bound(x.owners_estimate), reverse=True)
-            results = results[:limit]
+            # SteamSpy ranges don't overlap, so the lower bound orders them
+            query = query.filter(GameMetadata.owners_min.isnot(None))
+            query = query.order_by(GameMetadata.owners_min.desc())
+            results = query.limit(limit).all()
         elif sort_by == "reviews":
             query = query.filter(GameMetadata.positive_reviews.isnot(None))
             query = query.order_by(GameMetadata.positive_reviews.desc())
@@ -258,24 +272,6 @@ def top_games(
         raise typer.Exit(1)
 
 
-def extract_upper_bound(owners_estimate: str) -> int:
-    """Extract upper bound from owners estimate string for sorting."""
-    if not owners_estimate:
-        return 0
-    
-    try:
-        # Handle formats like "1,000,000 .. 2,000,000"
-        if ".." in owners_estimate:
-            upper = owners_estimate.split("..")[1].strip()
-        else:
-            upper = owners_estimate
-        
-        # Remove commas and convert to int
-        return int(upper.replace(",", ""))
-    except (ValueError, IndexError):
-        return 0
-
-
 @app.command()
 def summary():
     """Show overall database summary with key statistics."""
@@ -285,28 +281,21 @@ def summary():
         
         console.print("📊 Generating database summary...")
         
-        # Basic counts
-        total_games = session.query(Game).count()
-        active_games = session.query(Game).filter(Game.is_active == True).count()
-        total_metadata = session.query(GameMetadata).count()
-        
-        # Metadata status
-        successful_metadata = session.query(GameMetadata).filter(
-            GameMetadata.fetch_status == FetchStatus.SUCCESS.value
-        ).count()
-        
-        # Games with owner data
-        games_with_owners = session.query(GameMetadata).filter(
-            GameMetadata.owners_estimate.isnot(None)
-        ).count()
-        
-        # Average reviews for successful fetches
-        avg_positive_reviews = session.query(
-            func.avg(GameMetadata.positive_reviews)
-        ).filter(
-            GameMetadata.fetch_status == FetchStatus.SUCCESS.value,
-            GameMetadata.positive_reviews.isnot(None)
-        ).scalar()
+        # Game counts in one pass over games
+        total_games, active_games = session.query(
+            func.count(Game.app_id),
+            func.count(case((Game.is_active.is_(True), 1)))
+        ).one()
+        
+        # Metadata counts and average reviews for successful fetches in one pass;
+        # COUNT/AVG skip the NULLs produced by the unmatched CASE branches
+        is_success = GameMetadata.fetch_status == FetchStatus.SUCCESS.value
+        total_metadata, successful_metadata, games_with_owners, avg_positive_reviews = session.query(
+            func.count(GameMetadata.app_id),
+            func.count(case((is_success, 1))),
+            func.count(GameMetadata.owners_estimate),
+            func.avg(case((is_success, GameMetadata.positive_reviews)))
+        ).one()
         
         # Most common owner range
         top_owner_range = session.query(
@@ -321,13 +310,15 @@ def summary():
         ).first()
         
         # Create summary panel
+        avg_reviews_text = f"{avg_positive_reviews:.1f}" if avg_positive_reviews is not None else "N/A"
+        top_range_text = f"{top_owner_range[0]} ({top_owner_range[1]:,} games)" if top_owner_range else "N/A"
         summary_text = f"""Total Games: {total_games:,}
 Active Games: {active_games:,}
 Total Metadata Records: {total_metadata:,}
 Successful Metadata: {successful_metadata:,}
 Games with Owner Data: {games_with_owners:,}
-Average Positive Reviews: {avg_positive_reviews:.1f if avg_positive_reviews else 'N/A'}
-Most Common Owner Range: {top_owner_range[0] if top_owner_range else 'N/A'} ({top_owner_range[1]:,} games)"""
+Average Positive Reviews: {avg_reviews_text}
+Most Common Owner Range: {top_range_text}"""
         
         console.print(Panel(
             summary_text,
@@ -355,23 +346,12 @@ def million_plus_owners():
         
         console.print("🎮 Analyzing games with 1M+ owners...")
         
-        # Define owner ranges that indicate 1M+ owners
-        million_plus_ranges = [
-            "1,000,000 .. 2,000,000",
-            "2,000,000 .. 5,000,000", 
-            "5,000,000 .. 10,000,000",
-            "10,000,000 .. 20,000,000",
-            "20,000,000 .. 50,000,000",
-            "50,000,000 .. 100,000,000",
-            "100,000,000 .. 200,000,000"
-        ]
-        
         # Get count and distribution of 1M+ owner games
         results = session.query(
             GameMetadata.owners_estimate,
             func.count(GameMetadata.app_id).label('game_count')
         ).filter(
-            GameMetadata.owners_estimate.in_(million_plus_ranges)
+            GameMetadata.owners_min >= 1_000_000
         ).group_by(
             GameMetadata.owners_estimate
         ).order_by(
@@ -13,15 +13,13 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from sqlalchemy import create_engine, text
-from alembic.config import Config
-from alembic import command
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from config import settings
-from models import Base
+# SQLAlchemy, Alembic, settings and models are imported inside the functions
+# that use them, so --help and validate don't pay for loading the DB stack
+# (typer already loads rich)
 
 app = typer.Typer(
     name="setup-db",
@@ -30,9 +28,26 @@ app = typer.Typer(
 )
 console = Console()
 
+# Shared by every step of a command (init tests the connection, migrates,
+# then tests it again), so they reuse one connection pool
+_engine = None
+
+
+def get_engine():
+    """Get the shared database engine, creating it on first use."""
+    from sqlalchemy import create_engine
+    from config import settings
+    
+    global _engine
+    if _engine is None:
+        _engine = create_engine(settings.database_url)
+    return _engine
+
 
 def validate_environment():
     """Validate environment variables and settings."""
+    from config import settings
+    
     console.print("🔍 Validating environment...")
     
     errors = []
@@ -77,37 +92,35 @@ def validate_environment():
 
 def test_database_connection():
     """Test database connection and basic operations."""
+    from sqlalchemy import inspect, text
+    
     console.print("🔌 Testing database connection...")
     
     try:
-        engine = create_engine(settings.database_url)
+        engine = get_engine()
         
-        # Test basic connection
+        # Test basic connection; one connection serves every check below
         with engine.connect() as conn:
             result = conn.execute(text("SELECT 1"))
             assert result.fetchone()[0] == 1
-        
-        console.print("✅ Database connection successful")
-        
-        # Check if tables exist
-        from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        
-        if "games" in tables and "game_metadata" in tables:
-            console.print("✅ Required tables found")
             
-            # Get table counts
-            with engine.connect() as conn:
-                result = conn.execute(text("SELECT COUNT(*) FROM games"))
-                game_count = result.fetchone()[0]
+            console.print("✅ Database connection successful")
+            
+            # Check if tables exist (has_table looks up just these two
+            # rather than reflecting every table name)
+            inspector = inspect(conn)
+            
+            if inspector.has_table("games") and inspector.has_table("game_metadata"):
+                console.print("✅ Required tables found")
                 
-                result = conn.execute(text("SELECT COUNT(*) FROM game_metadata"))
-                metadata_count = result.fetchone()[0]
+                # Get table counts in one round trip
+                game_count, metadata_count = conn.execute(text(
+                    "SELECT (SELECT COUNT(*) FROM games), (SELECT COUNT(*) FROM game_metadata)"
+                )).one()
                 
                 console.print(f"📊 Current data: {game_count} games, {metadata_count} metadata records")
-        else:
-            console.print("ℹ️  Tables not found (run migrations to create)")
+            else:
+                console.print("ℹ️  Tables not found (run migrations to create)")
         
         return True
         
@@ -122,6 +135,10 @@ def test_database_connection():
 
 def run_migrations():
     """Run Alembic database migrations."""
+    from alembic import command
+    from alembic.config import Config
+    from config import settings
+    
     console.print("🔄 Running database migrations...")
     
     try:
@@ -143,8 +160,11 @@ def run_migrations():
         # Override database URL in config
         alembic_cfg.set_main_option("sqlalchemy.url", settings.database_url)
         
-        # Run migrations
-        command.upgrade(alembic_cfg, "head")
+        # Run migrations on the shared engine; env.py uses this connection
+        # instead of creating its own engine
+        with get_engine().begin() as connection:
+            alembic_cfg.attributes["connection"] = connection
+            command.upgrade(alembic_cfg, "head")
         
         console.print("✅ Database migrations completed")
         return True
@@ -160,11 +180,12 @@ def run_migrations():
 
 def create_database_tables():
     """Create database tables using SQLAlchemy (alternative to migrations)."""
+    from models import Base
+    
     console.print("🏗️  Creating database tables...")
     
     try:
-        engine = create_engine(settings.database_url)
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         
         console.print("✅ Database tables created")
         return True
@@ -264,10 +285,18 @@ def reset(
         False,
         "--confirm",
         help="Confirm database reset (required)"
+    ),
+    hard: bool = typer.Option(
+        False,
+        "--hard",
+        help="Drop and recreate all tables instead of emptying them"
     )
 ):
     """
-    Reset database by dropping and recreating all tables.
+    Reset database by deleting all data.
+    
+    Tables are emptied in place by default; use --hard to drop and
+    recreate them (e.g. after changing the models).
     
     ⚠️  WARNING: This will delete all data!
     """
@@ -280,18 +309,35 @@ def reset(
         ))
         raise typer.Exit(1)
     
+    from sqlalchemy import text
+    from models import Base
+    
     console.print("⚠️  Resetting database...")
     
     try:
-        engine = create_engine(settings.database_url)
-        
-        # Drop all tables
-        Base.metadata.drop_all(bind=engine)
-        console.print("🗑️  Dropped all tables")
+        engine = get_engine()
         
-        # Recreate all tables
-        Base.metadata.create_all(bind=engine)
-        console.print("🏗️  Recreated all tables")
+        if hard:
+            # Drop and recreate all tables in one transaction on one connection
+            with engine.begin() as conn:
+                Base.metadata.drop_all(bind=conn)
+                console.print("🗑️  Dropped all tables")
+                
+                Base.metadata.create_all(bind=conn)
+                console.print("🏗️  Recreated all tables")
+        else:
+            with engine.begin() as conn:
+                # Create any missing tables, then empty them all in one transaction
+                Base.metadata.create_all(bind=conn)
+                tables = Base.metadata.sorted_tables
+                if conn.dialect.name == "sqlite":
+                    # SQLite has no TRUNCATE; delete children before parents
+                    for table in reversed(tables):
+                        conn.execute(table.delete())
+                else:
+                    table_names = ", ".join(table.name for table in tables)
+                    conn.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+            console.print("🗑️  Deleted all data")
         
         console.print(Panel(
             "✅ Database reset completed successfully",
@@ -1,36 +1,94 @@
 import pytest
-import pytest_asyncio
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+import httpx
 
-from models import Base
+# SQLAlchemy and the models are imported inside the database fixtures so test
+# modules that don't use the database (e.g. the rate limiter tests) can run
+# without loading them
 
 
-@pytest.fixture(scope="function")
+class FakeServer:
+    """
+    Serves canned responses to requests sent through httpx.MockTransport.
+    
+    Responses are keyed by URL, or by path to match any query string; a list
+    of responses is served one per request, and an exception is raised as if
+    the request failed.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requested = []
+
+    def handle(self, request):
+        url = str(request.url)
+        self.requested.append(url)
+        response = self.routes[url] if url in self.routes else self.routes[request.url.path]
+        if isinstance(response, list):
+            response = response.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def reset(self):
+        """Forget the routes and requests of the previous test."""
+        self.routes.clear()
+        self.requested.clear()
+
+
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create an in-memory SQLite database for testing."""
+    """Create an in-memory SQLite database, with the schema, shared by all tests."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+    from models import Base
+    
     engine = create_engine(
         "sqlite:///:memory:",
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
     
-    # Enable foreign key constraints in SQLite
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
+        # Enable foreign key constraints in SQLite
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Stop pysqlite from managing transactions itself so the SAVEPOINTs
+        # and rollbacks that isolate tests behave (BEGIN is emitted below)
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     Base.metadata.create_all(engine)
     return engine
 
 
 @pytest.fixture(scope="function")
-def db_session(db_engine):
-    """Create a database session for testing."""
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+def db_connection(db_engine):
+    """Open a connection in a transaction that is rolled back after the test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """Create a database session for testing; its commits only release a SAVEPOINT."""
+    from sqlalchemy.orm import sessionmaker
+    
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
     session = SessionLocal()
     try:
         yield session
@@ -38,6 +96,65 @@ def db_session(db_engine):
         session.close()
 
 
+@pytest.fixture(scope="function")
+def sql_statements(db_engine):
+    """Record the SQL statements executed against the test database."""
+    from sqlalchemy import event
+    
+    statements = []
+    
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(db_engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record_statement)
+
+
+@pytest.fixture
+def instant_retries(monkeypatch):
+    """Retry failed requests without the real back-off waits."""
+    monkeypatch.setattr("utils.http_client.RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr("utils.rate_limiter.RETRY_DELAY", 0)
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """Create the Flask app once; tests point it at their own database."""
+    from app import create_app
+    return create_app('testing')
+
+
+@pytest.fixture
+def fake_server():
+    """Fake server for a test's HTTP requests."""
+    return FakeServer()
+
+
+@pytest.fixture(scope="session")
+def steam_api_server():
+    """Fake Steam Web API server shared by all tests (see steam_server)."""
+    return FakeServer()
+
+
+@pytest.fixture
+def steam_server(steam_api_server):
+    """Fake Steam Web API server answering steam_client, with no routes yet."""
+    steam_api_server.reset()
+    return steam_api_server
+
+
+@pytest.fixture(scope="session")
+async def steam_client(steam_api_server):
+    """Create one Steam API client, and its HTTP connection pool, for all tests."""
+    from utils.steam_api_client import SteamAPIClient
+    transport = httpx.MockTransport(steam_api_server.handle)
+    async with SteamAPIClient(api_key="test_key", transport=transport) as client:
+        yield client
+
+
 @pytest.fixture
 def sample_game_data():
     """Sample game data for testing."""
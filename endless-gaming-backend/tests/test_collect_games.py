@@ -0,0 +1,47 @@
+"""
+Tests for the collect_games CLI script.
+"""
+from unittest.mock import AsyncMock, patch
+
+from collectors.steamspy_all_collector import SteamSpyAllCollector
+from collectors.steamspy_collector import SteamSpyMetadataCollector
+from scripts.collect_games import collect_interleaved
+from utils.rate_limiter import APIEndpoint, SimpleRateLimiter
+
+
+GAMES_PAGE = {
+    str(app_id): {"appid": app_id, "name": f"Game {app_id}"} for app_id in (1, 2, 3)
+}
+
+METADATA_RESULT = {
+    "total_games_processed": 3,
+    "successful_fetches": 3,
+    "failed_fetches": 0,
+    "not_found": 0,
+}
+
+
+class TestCollectInterleaved:
+    """Test the page -> metadata -> storefront collection loop."""
+
+    async def test_rerun_reuses_cached_storefront_data(self, db_session, tmp_path):
+        """Test that a second run over the same games sends no Steam Store requests."""
+        store_requests = []
+
+        async def make_request(self, endpoint, url, **kwargs):
+            assert endpoint == APIEndpoint.STEAM_STORE_APPDETAILS_API
+            store_requests.append(url)
+            app_id = url.rsplit("=", 1)[1]
+            return {app_id: {"success": True, "data": {"short_description": f"Game {app_id}"}}}
+
+        with patch.object(SteamSpyAllCollector, "fetch_games_page", AsyncMock(return_value=GAMES_PAGE)), \
+             patch.object(SteamSpyMetadataCollector, "collect_metadata_for_games",
+                          AsyncMock(return_value=METADATA_RESULT)), \
+             patch.object(SimpleRateLimiter, "make_request", make_request):
+            first_run = await collect_interleaved(db_session, max_pages=1, cache_dir=tmp_path)
+            requests_after_first_run = len(store_requests)
+            second_run = await collect_interleaved(db_session, max_pages=1, cache_dir=tmp_path)
+
+        assert first_run == second_run == (3, 3, 3)
+        assert requests_after_first_run == 3
+        assert len(store_requests) == 3
@@ -5,13 +5,12 @@ These tests follow TDD principles - they are written first and should fail
 until the actual implementation is complete.
 """
 import pytest
-import json
+import orjson
 from unittest.mock import patch, MagicMock
 from flask import Flask
 from sqlalchemy.exc import DatabaseError
 
 from app import create_app
-from app.config import TestingConfig
 from models.game import Game
 from models.game_metadata import GameMetadata, FetchStatus
 
@@ -48,13 +47,17 @@ class TestMasterJsonEndpoint:
     """Test the GET /discovery/games/master.json endpoint."""
 
     @pytest.fixture
-    def client(self, db_engine):
+    def client(self, flask_app, db_engine, db_connection):
         """Create test client with test database."""
-        app = create_app('testing')
-        # Override the app's database engine with the test engine
+        app = flask_app
+        # Override the app's database engine with the test engine, and have its
+        # sessions join the test's transaction so they see (and roll back with)
+        # the test's data
         app.db_engine = db_engine
         from sqlalchemy.orm import sessionmaker
-        app.db_session_factory = sessionmaker(bind=db_engine)
+        app.db_session_factory = sessionmaker(
+            bind=db_connection, join_transaction_mode="create_savepoint"
+        )
         return app.test_client()
 
     @pytest.fixture
@@ -100,11 +103,19 @@ class TestMasterJsonEndpoint:
             fetch_status=FetchStatus.SUCCESS.value
         )
         
+        # Flushing is enough: the client's sessions share this test's transaction
         db_session.add_all([game1, game2, game3, metadata1, metadata2, metadata3])
-        db_session.commit()
+        db_session.flush()
         
         return [game1, game2, game3]
 
+    @pytest.fixture
+    def master_json(self, client, sample_games_with_metadata):
+        """Request master.json for the sample games once and decode it, with games indexed by appId."""
+        response = client.get('/discovery/games/master.json')
+        data = orjson.loads(response.data)
+        return response, data, {game['appId']: game for game in data}
+
     def test_endpoint_returns_200_status(self, client):
         """Test that the endpoint returns 200 status code."""
         # This test will initially fail due to NotImplementedError
@@ -113,29 +124,24 @@ class TestMasterJsonEndpoint:
         # This is intentional for TDD
         assert response.status_code == 200
 
-    def test_response_is_valid_json_array(self, client, sample_games_with_metadata):
+    def test_response_is_valid_json_array(self, master_json):
         """Test that response is a valid JSON array."""
-        response = client.get('/discovery/games/master.json')
-        
         # Should return valid JSON
-        data = json.loads(response.data)
+        response, data, by_id = master_json
         assert isinstance(data, list)
 
-    def test_only_active_games_included(self, client, sample_games_with_metadata):
+    def test_only_active_games_included(self, master_json):
         """Test that only active games are included in response."""
-        response = client.get('/discovery/games/master.json')
-        data = json.loads(response.data)
+        response, data, by_id = master_json
         
         # Should only include active games with metadata (CS:GO and TF2, not Dota 2)
-        app_ids = [game['appId'] for game in data]
-        assert 730 in app_ids  # CS:GO (active, has metadata)
-        assert 440 in app_ids  # TF2 (active, has metadata)
-        assert 570 not in app_ids  # Dota 2 (inactive)
+        assert 730 in by_id  # CS:GO (active, has metadata)
+        assert 440 in by_id  # TF2 (active, has metadata)
+        assert 570 not in by_id  # Dota 2 (inactive)
 
-    def test_game_record_format_camel_case(self, client, sample_games_with_metadata):
+    def test_game_record_format_camel_case(self, master_json):
         """Test that game records use camelCase field names."""
-        response = client.get('/discovery/games/master.json')
-        data = json.loads(response.data)
+        response, data, by_id = master_json
         
         if data:  # If we have games
             game = data[0]
@@ -149,13 +155,12 @@ class TestMasterJsonEndpoint:
             assert 'app_id' not in game
             assert 'positive_reviews' not in game
 
-    def test_tags_format_correct(self, client, sample_games_with_metadata):
+    def test_tags_format_correct(self, master_json):
         """Test that tags are formatted correctly as object with vote counts."""
-        response = client.get('/discovery/games/master.json')
-        data = json.loads(response.data)
+        response, data, by_id = master_json
         
         # Find CS:GO which has tags
-        csgo = next((g for g in data if g['appId'] == 730), None)
+        csgo = by_id.get(730)
         if csgo:
             assert 'tags' in csgo
             assert isinstance(csgo['tags'], dict)
@@ -163,16 +168,24 @@ class TestMasterJsonEndpoint:
             assert 'FPS' in csgo['tags']
             assert isinstance(csgo['tags']['FPS'], int)
 
-    def test_price_formatting(self, client, sample_games_with_metadata):
+    def test_price_formatting(self, master_json):
         """Test that price is formatted correctly."""
-        response = client.get('/discovery/games/master.json')
-        data = json.loads(response.data)
+        response, data, by_id = master_json
         
         # Find CS:GO which should be "Free"
-        csgo = next((g for g in data if g['appId'] == 730), None)
+        csgo = by_id.get(730)
         if csgo:
             assert csgo['price'] == "Free"
 
+    def test_games_loaded_in_one_query(self, client, sample_games_with_metadata, sql_statements):
+        """Test that metadata and storefront data are eager loaded, not queried per game."""
+        sql_statements.clear()
+        response = client.get('/discovery/games/master.json')
+        
+        assert len(orjson.loads(response.data)) == 2
+        selects = [s for s in sql_statements if s.lstrip().upper().startswith('SELECT')]
+        assert len(selects) == 1
+
     def test_database_error_returns_503(self, client):
         """Test that database errors return 503 status."""
         # This will test error handling once implemented
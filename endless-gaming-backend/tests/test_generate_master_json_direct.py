@@ -0,0 +1,183 @@
+"""
+Tests for the direct master.json generator script.
+"""
+import asyncio
+import pytest
+import orjson
+from unittest.mock import patch
+
+from scripts.generate_master_json_direct import (
+    DirectGameDataCollector,
+    generate_master_json,
+    write_json_array,
+)
+
+
+def games_page(*app_ids):
+    """Build a SteamSpy /all page listing the given games in popularity order."""
+    return {str(app_id): {"appid": app_id, "name": f"Game {app_id}"} for app_id in app_ids}
+
+
+def game_metadata(app_id):
+    """Build a SteamSpy appdetails response with tags, so the game is kept."""
+    return {"appid": app_id, "name": f"Game {app_id}", "tags": {"Action": 100}}
+
+
+async def collect(collector, **kwargs):
+    """Collect every game record and return their app IDs in output order."""
+    return [record["appId"] async for record in collector.collect_game_data(skip_storefront=True, **kwargs)]
+
+
+async def records(*app_ids):
+    """Yield minimal game records for write_json_array."""
+    for app_id in app_ids:
+        yield {"appId": app_id, "name": f"Game {app_id}"}
+
+
+@pytest.fixture
+async def collector():
+    """Create a collector whose HTTP client is closed after the test."""
+    collector = DirectGameDataCollector()
+    yield collector
+    await collector.close()
+
+
+class TestCollectGameData:
+    """Test streaming game records from the page and detail fetches."""
+
+    async def test_records_keep_popularity_order(self, collector):
+        """Test that records come out in /all order even when fetches finish out of order."""
+        pages = [games_page(1, 2, 3, 4)]
+
+        async def fetch_games_page(page):
+            return pages[page] if page < len(pages) else {}
+
+        async def fetch_game_details(app_id, skip_storefront=False):
+            # The most popular games take longest, so they finish last
+            await asyncio.sleep((5 - app_id) * 0.01)
+            return game_metadata(app_id), None
+
+        collector.fetch_games_page = fetch_games_page
+        collector.fetch_game_details = fetch_game_details
+
+        assert await collect(collector, batch_size=4) == [1, 2, 3, 4]
+
+    async def test_max_games_truncates_and_cancels_remaining_fetches(self, collector):
+        """Test that collection stops at max_games and cancels fetches still in flight."""
+        started = []
+        cancelled = []
+        never_set = asyncio.Event()
+
+        async def fetch_games_page(page):
+            return games_page(1, 2, 3, 4, 5, 6) if page == 0 else {}
+
+        async def fetch_game_details(app_id, skip_storefront=False):
+            started.append(app_id)
+            if app_id > 2:
+                try:
+                    await never_set.wait()
+                except asyncio.CancelledError:
+                    cancelled.append(app_id)
+                    raise
+            return game_metadata(app_id), None
+
+        collector.fetch_games_page = fetch_games_page
+        collector.fetch_game_details = fetch_game_details
+
+        assert await collect(collector, batch_size=3, max_games=2) == [1, 2]
+        assert set(started) > {1, 2}
+        assert sorted(cancelled) == sorted(set(started) - {1, 2})
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_duplicate_app_ids_fetched_once(self, collector):
+        """Test that a game listed on several /all pages is fetched and written once."""
+        pages = [games_page(1, 2), games_page(2, 3)]
+        fetched = []
+
+        async def fetch_games_page(page):
+            return pages[page] if page < len(pages) else {}
+
+        async def fetch_game_details(app_id, skip_storefront=False):
+            fetched.append(app_id)
+            return game_metadata(app_id), None
+
+        collector.fetch_games_page = fetch_games_page
+        collector.fetch_game_details = fetch_game_details
+
+        assert await collect(collector, max_pages=2, batch_size=2) == [1, 2, 3]
+        assert sorted(fetched) == [1, 2, 3]
+
+
+class TestWriteJsonArray:
+    """Test streaming records into a JSON array file."""
+
+    @pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+    async def test_writes_valid_json_array(self, tmp_path, pretty):
+        """Test that the file parses back to the records written."""
+        path = tmp_path / "master.json"
+
+        count = await write_json_array(path, records(1, 2, 3), pretty)
+
+        assert count == 3
+        assert orjson.loads(path.read_bytes()) == [
+            {"appId": app_id, "name": f"Game {app_id}"} for app_id in (1, 2, 3)
+        ]
+
+    async def test_compact_output_framing(self, tmp_path):
+        """Test that compact output has no whitespace between records."""
+        path = tmp_path / "master.json"
+
+        await write_json_array(path, records(1, 2))
+
+        assert path.read_bytes() == b'[{"appId":1,"name":"Game 1"},{"appId":2,"name":"Game 2"}]'
+
+    async def test_pretty_output_framing(self, tmp_path):
+        """Test that pretty output indents each record one level inside the array."""
+        path = tmp_path / "master.json"
+
+        await write_json_array(path, records(1), pretty=True)
+
+        assert path.read_bytes() == b'[\n  {\n    "appId": 1,\n    "name": "Game 1"\n  }\n]'
+
+    @pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+    async def test_empty_array(self, tmp_path, pretty):
+        """Test that no records produce an empty JSON array."""
+        path = tmp_path / "master.json"
+
+        count = await write_json_array(path, records(), pretty)
+
+        assert count == 0
+        assert path.read_bytes() == b'[]'
+
+
+class TestGenerateMasterJson:
+    """Test writing master.json from the collected records."""
+
+    async def test_failed_run_removes_partial_file(self, tmp_path):
+        """Test that a failed run leaves neither master.json nor its partial file."""
+        output_file = tmp_path / "master.json"
+        original_to_game_record = DirectGameDataCollector.to_game_record
+
+        def to_game_record(self, basic_game_data, metadata, storefront_data=None):
+            # Fail part-way through writing, after the first record
+            if basic_game_data["appid"] == 2:
+                raise RuntimeError("conversion failed")
+            return original_to_game_record(self, basic_game_data, metadata, storefront_data)
+
+        async def fetch_games_page(self, page):
+            return games_page(1, 2, 3)
+
+        async def fetch_game_details(self, app_id, skip_storefront=False):
+            return game_metadata(app_id), None
+
+        with patch.object(DirectGameDataCollector, "fetch_games_page", fetch_games_page), \
+             patch.object(DirectGameDataCollector, "fetch_game_details", fetch_game_details), \
+             patch.object(DirectGameDataCollector, "to_game_record", to_game_record):
+            with pytest.raises(SystemExit):
+                await generate_master_json(
+                    str(output_file), max_pages=1, batch_size=2, skip_storefront=True, use_cache=False
+                )
+
+        assert list(tmp_path.iterdir()) == []
+        # The collection's producer and workers were stopped, not left running
+        assert asyncio.all_tasks() == {asyncio.current_task()}
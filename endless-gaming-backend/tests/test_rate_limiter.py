@@ -1,13 +1,28 @@
 import pytest
 import asyncio
-import time
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import patch
 import httpx
 
-from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
+from utils.rate_limiter import SimpleRateLimiter, APIEndpoint, AdaptiveConcurrency, is_rate_limited
 from utils.http_client import HTTPClient
 
 
+@pytest.fixture(scope="module")
+async def rate_limiter():
+    """Rate limiter shared by tests that don't send requests through it; closed after them."""
+    limiter = SimpleRateLimiter()
+    yield limiter
+    await limiter.close()
+
+
+@pytest.fixture
+async def served_rate_limiter(fake_server):
+    """Rate limiter whose requests are answered by fake_server; closed after the test."""
+    limiter = SimpleRateLimiter(HTTPClient(transport=httpx.MockTransport(fake_server.handle)))
+    yield limiter
+    await limiter.close()
+
+
 class TestAPIEndpoint:
     """Test cases for APIEndpoint enum."""
 
@@ -17,49 +32,43 @@ class TestAPIEndpoint:
         assert APIEndpoint.STEAM_STORE_API.value == "steam_store_api"  
         assert APIEndpoint.STEAMSPY_API.value == "steamspy_api"
 
-    def test_api_endpoint_rate_limits(self):
+    @pytest.mark.parametrize("endpoint,expected", [
+        (APIEndpoint.STEAM_WEB_API, "100000/day"),
+        (APIEndpoint.STEAM_STORE_API, "200/5minutes"),
+        (APIEndpoint.STEAM_STORE_APPDETAILS_API, "40/minute"),
+        (APIEndpoint.STEAMSPY_API, "60/minute"),
+        (APIEndpoint.STEAMSPY_ALL_API, "1/minute"),
+    ])
+    def test_api_endpoint_rate_limits(self, rate_limiter, endpoint, expected):
         """Test that each endpoint has proper rate limit configuration."""
-        rate_limiter = SimpleRateLimiter()
-        
-        # Test that each endpoint has different rate limits configured
-        steam_web_limit = rate_limiter.get_limit(APIEndpoint.STEAM_WEB_API)
-        steam_store_limit = rate_limiter.get_limit(APIEndpoint.STEAM_STORE_API)
-        steamspy_limit = rate_limiter.get_limit(APIEndpoint.STEAMSPY_API)
-        
-        assert steam_web_limit == "100000/day"
-        assert steam_store_limit == "200/5minutes" 
-        assert steamspy_limit == "60/minute"
+        assert rate_limiter.get_limit(endpoint) == expected
 
 
 class TestSimpleRateLimiter:
     """Test cases for SimpleRateLimiter class."""
 
-    def test_rate_limiter_initialization(self):
-        """Test that rate limiter initializes correctly."""
-        rate_limiter = SimpleRateLimiter()
-        assert rate_limiter is not None
-        
-        # Test that it has proper configuration for all endpoints
-        for endpoint in APIEndpoint:
-            limit = rate_limiter.get_limit(endpoint)
-            assert limit is not None
+    async def test_rate_limiter_uses_shared_http_client(self):
+        """Test that rate limiters can share one pooled HTTP client."""
+        http_client = HTTPClient()
+        try:
+            first = SimpleRateLimiter(http_client)
+            second = SimpleRateLimiter(http_client)
+            
+            assert first.http_client is http_client
+            assert second.http_client is http_client
+        finally:
+            await http_client.close()
 
-    def test_throttle_allows_initial_requests(self):
+    def test_throttle_allows_initial_requests(self, rate_limiter):
         """Test that throttle allows requests initially."""
-        rate_limiter = SimpleRateLimiter()
-        
-        # First call should not block
-        start_time = time.time()
-        rate_limiter.throttle(APIEndpoint.STEAMSPY_API)
-        elapsed = time.time() - start_time
+        # First call should go straight through the endpoint's limiter
+        with patch.object(rate_limiter.limiters[APIEndpoint.STEAMSPY_API], 'acquire') as mock_acquire:
+            rate_limiter.throttle(APIEndpoint.STEAMSPY_API)
         
-        # Should complete almost immediately (< 0.1 seconds)
-        assert elapsed < 0.1
+        mock_acquire.assert_awaited_once()
 
-    def test_throttle_blocks_when_rate_limit_exceeded(self):
+    def test_throttle_blocks_when_rate_limit_exceeded(self, rate_limiter):
         """Test that throttle blocks when rate limit is exceeded."""
-        rate_limiter = SimpleRateLimiter()
-        
         # Mock the async limiter to simulate rate limiting
         with patch.object(rate_limiter.limiters[APIEndpoint.STEAMSPY_API], 'acquire') as mock_acquire:
             # First call succeeds, subsequent calls simulate waiting
@@ -68,18 +77,13 @@ class TestSimpleRateLimiter:
             
             mock_acquire.side_effect = mock_acquire_with_delay
             
-            # The throttle method should handle the rate limiting
-            start_time = time.time()
+            # The throttle method should wait for the limiter to allow the call
             rate_limiter.throttle(APIEndpoint.STEAMSPY_API)
-            elapsed = time.time() - start_time
             
-            # Should complete (mock doesn't actually block sync calls)
-            assert elapsed >= 0
+            mock_acquire.assert_awaited_once()
 
-    def test_different_endpoints_have_independent_limits(self):
+    def test_different_endpoints_have_independent_limits(self, rate_limiter):
         """Test that different API endpoints have independent rate limits."""
-        rate_limiter = SimpleRateLimiter()
-        
         # Test that different endpoints have different limiter instances
         steamspy_limiter = rate_limiter.limiters[APIEndpoint.STEAMSPY_API]
         steam_web_limiter = rate_limiter.limiters[APIEndpoint.STEAM_WEB_API]
@@ -87,159 +91,166 @@ class TestSimpleRateLimiter:
         assert steamspy_limiter is not steam_web_limiter
         assert steamspy_limiter.max_rate != steam_web_limiter.max_rate
 
-    @pytest.mark.asyncio
-    async def test_make_request_integration(self):
+    async def test_make_request_integration(self, fake_server, served_rate_limiter):
         """Test make_request method with mocked HTTP response."""
-        rate_limiter = SimpleRateLimiter()
-        
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_response.raise_for_status.return_value = None
-        
-        with patch('httpx.AsyncClient.get', return_value=mock_response) as mock_get:
-            result = await rate_limiter.make_request(
-                APIEndpoint.STEAM_WEB_API,
-                "https://api.steampowered.com/test"
-            )
-            
-            assert result == {"test": "data"}
-            mock_get.assert_called_once()
+        url = "https://api.steampowered.com/test"
+        fake_server.routes[url] = httpx.Response(200, json={"test": "data"})
+        
+        result = await served_rate_limiter.make_request(APIEndpoint.STEAM_WEB_API, url)
+        
+        assert result == {"test": "data"}
+        assert fake_server.requested == [url]
 
-    @pytest.mark.asyncio 
-    async def test_make_request_retry_on_failure(self):
+    async def test_make_request_retry_on_failure(self, fake_server, served_rate_limiter, instant_retries):
         """Test that make_request retries on network failures."""
-        rate_limiter = SimpleRateLimiter()
-        
-        # Mock network error followed by success
-        mock_error_response = Mock()
-        mock_error_response.raise_for_status.side_effect = httpx.HTTPError("Network error")
+        url = "https://api.steampowered.com/test"
+        # Server error followed by success
+        fake_server.routes[url] = [
+            httpx.Response(503),
+            httpx.Response(200, json={"retry": "success"}),
+        ]
         
-        mock_success_response = Mock()
-        mock_success_response.json.return_value = {"retry": "success"}
-        mock_success_response.raise_for_status.return_value = None
+        result = await served_rate_limiter.make_request(APIEndpoint.STEAM_WEB_API, url)
         
-        with patch('httpx.AsyncClient.get', side_effect=[mock_error_response, mock_success_response]) as mock_get:
-            result = await rate_limiter.make_request(
-                APIEndpoint.STEAM_WEB_API,
-                "https://api.steampowered.com/test"
-            )
-            
-            assert result == {"retry": "success"}
-            assert mock_get.call_count == 2  # Should have retried once
+        assert result == {"retry": "success"}
+        assert len(fake_server.requested) == 2  # Should have retried once
 
-    @pytest.mark.asyncio
-    async def test_make_request_respects_rate_limit(self):
+    async def test_make_request_respects_rate_limit(self, fake_server, served_rate_limiter):
         """Test that make_request respects rate limiting."""
-        rate_limiter = SimpleRateLimiter()
-        
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": "test"}
-        mock_response.raise_for_status.return_value = None
-        
-        with patch('httpx.AsyncClient.get', return_value=mock_response):
-            # Make a single request to verify integration
-            result = await rate_limiter.make_request(
-                APIEndpoint.STEAMSPY_API,
-                "https://steamspy.com/api.php?request=appdetails&appid=1"
-            )
-            
-            assert result == {"data": "test"}
+        url = "https://steamspy.com/api.php?request=appdetails&appid=1"
+        fake_server.routes[url] = httpx.Response(200, json={"data": "test"})
+        
+        # Make a single request to verify integration
+        result = await served_rate_limiter.make_request(APIEndpoint.STEAMSPY_API, url)
+        
+        assert result == {"data": "test"}
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for AdaptiveConcurrency."""
+    
+    def test_rate_limited_halves_limit(self):
+        """Test that each 429 halves the limit, never below one."""
+        concurrency = AdaptiveConcurrency(8)
+        
+        concurrency.record_rate_limited()
+        assert concurrency.limit == 4
+        
+        for _ in range(5):
+            concurrency.record_rate_limited()
+        assert concurrency.limit == 1
+    
+    def test_successes_grow_limit_up_to_max(self):
+        """Test that runs of successes raise the limit back to the maximum."""
+        concurrency = AdaptiveConcurrency(4, grow_after=2)
+        concurrency.record_rate_limited()
+        assert concurrency.limit == 2
+        
+        for _ in range(10):
+            concurrency.record_success()
+        assert concurrency.limit == 4
+    
+    async def test_limits_units_in_flight(self):
+        """Test that no more than the current limit run concurrently."""
+        concurrency = AdaptiveConcurrency(4)
+        concurrency.record_rate_limited()
+        peak = 0
+        
+        async def work():
+            nonlocal peak
+            async with concurrency:
+                peak = max(peak, concurrency.in_flight)
+                await asyncio.sleep(0.01)
+        
+        await asyncio.gather(*(work() for _ in range(8)))
+        
+        assert peak == 2
+        assert concurrency.in_flight == 0
+    
+    def test_is_rate_limited_detects_429(self):
+        """Test that only HTTP 429 responses count as rate limiting."""
+        request = httpx.Request("GET", "https://test.com")
+        
+        def status_error(status_code):
+            response = httpx.Response(status_code, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+        
+        assert is_rate_limited(status_error(429))
+        assert not is_rate_limited(status_error(500))
+        assert not is_rate_limited(httpx.ConnectError("failed"))
 
 
 class TestHTTPClient:
     """Test cases for HTTP client integration."""
 
-    @pytest.mark.asyncio
     async def test_http_client_initialization(self):
         """Test HTTP client initializes with proper configuration."""
         client = HTTPClient()
         assert client is not None
         assert hasattr(client, 'session')
 
-    @pytest.mark.asyncio
-    async def test_http_client_retry_logic(self):
+    async def test_http_client_retry_logic(self, fake_server, instant_retries):
         """Test HTTP client retry logic with exponential backoff."""
-        client = HTTPClient()
+        client = HTTPClient(transport=httpx.MockTransport(fake_server.handle))
         
-        # Mock client that fails twice then succeeds
-        with patch.object(client.session, 'get') as mock_get:
-            # Configure mock to fail twice, then succeed
-            mock_get.side_effect = [
-                httpx.HTTPError("First failure"),
-                httpx.HTTPError("Second failure"), 
-                Mock(json=lambda: {"success": True}, raise_for_status=lambda: None)
-            ]
-            
-            result = await client.get_with_retry("https://test.com")
-            
-            assert result == {"success": True}
-            assert mock_get.call_count == 3
+        # Fail twice, then succeed
+        fake_server.routes["https://test.com"] = [
+            httpx.Response(503),
+            httpx.Response(503),
+            httpx.Response(200, json={"success": True}),
+        ]
+        
+        result = await client.get_with_retry("https://test.com")
+        
+        assert result == {"success": True}
+        assert len(fake_server.requested) == 3
 
-    @pytest.mark.asyncio
-    async def test_http_client_timeout_handling(self):
-        """Test HTTP client handles timeouts correctly."""
-        from tenacity import RetryError
+    async def test_http_client_timeout_handling(self, instant_retries):
+        """Test HTTP client raises the timeout once max_retries attempts have failed."""
         client = HTTPClient()
         
         with patch.object(client.session, 'get') as mock_get:
             mock_get.side_effect = asyncio.TimeoutError("Request timeout")
             
-            with pytest.raises(RetryError):
-                await client.get_with_retry("https://test.com", max_retries=1)
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get_with_retry("https://test.com", max_retries=2)
+            
+            assert mock_get.call_count == 2
 
 
 class TestRateLimiterIntegration:
     """Integration tests for rate limiter with HTTP client."""
 
-    @pytest.mark.asyncio
-    async def test_concurrent_requests_shared_rate_limiter(self):
+    async def test_concurrent_requests_shared_rate_limiter(self, fake_server, served_rate_limiter):
         """Test that concurrent requests share the same rate limiter."""
-        rate_limiter = SimpleRateLimiter()
-        
-        mock_response = Mock()
-        mock_response.json.return_value = {"concurrent": "test"}
-        mock_response.raise_for_status.return_value = None
-        
-        with patch('httpx.AsyncClient.get', return_value=mock_response):
-            # Create multiple concurrent requests
-            tasks = []
-            for i in range(3):
-                task = rate_limiter.make_request(
-                    APIEndpoint.STEAMSPY_API,
-                    f"https://steamspy.com/api.php?request=appdetails&appid={i}"
-                )
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks)
-            
-            # All requests should complete
-            assert len(results) == 3
-            assert all(result == {"concurrent": "test"} for result in results)
-
-    @pytest.mark.asyncio 
-    async def test_rate_limiter_preserves_order_within_limits(self):
-        """Test that rate limiter processes requests in reasonable order."""
-        rate_limiter = SimpleRateLimiter()
+        urls = [f"https://steamspy.com/api.php?request=appdetails&appid={i}" for i in range(3)]
+        for url in urls:
+            fake_server.routes[url] = httpx.Response(200, json={"concurrent": "test"})
         
-        request_order = []
-        
-        def track_request(url, **kwargs):
-            request_order.append(url)
-            mock_response = Mock()
-            mock_response.json.return_value = {"url": url}
-            mock_response.raise_for_status.return_value = None
-            return mock_response
-        
-        with patch('httpx.AsyncClient.get', side_effect=track_request):
-            urls = [f"https://test.com/{i}" for i in range(3)]
+        # Create multiple concurrent requests
+        async with asyncio.TaskGroup() as tg:
             tasks = [
-                rate_limiter.make_request(APIEndpoint.STEAM_WEB_API, url)
+                tg.create_task(served_rate_limiter.make_request(APIEndpoint.STEAMSPY_API, url))
                 for url in urls
             ]
-            
-            results = await asyncio.gather(*tasks)
-            
-            # All requests should complete successfully
-            assert len(results) == 3
-            assert len(request_order) == 3
\ No newline at end of file
+        results = [task.result() for task in tasks]
+        
+        # All requests should complete
+        assert len(results) == 3
+        assert all(result == {"concurrent": "test"} for result in results)
+
+    async def test_rate_limiter_preserves_order_within_limits(self, fake_server, served_rate_limiter):
+        """Test that rate limiter processes requests in reasonable order."""
+        urls = [f"https://test.com/{i}" for i in range(3)]
+        for url in urls:
+            fake_server.routes[url] = httpx.Response(200, json={"url": url})
+        tasks = [
+            served_rate_limiter.make_request(APIEndpoint.STEAM_WEB_API, url)
+            for url in urls
+        ]
+        
+        results = await asyncio.gather(*tasks)
+        
+        # All requests should complete successfully
+        assert len(results) == 3
+        assert len(fake_server.requested) == 3
@@ -0,0 +1,45 @@
+import time
+from unittest.mock import patch
+
+from utils.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test cases for the on-disk ResponseCache."""
+
+    def test_get_returns_none_on_miss(self, tmp_path):
+        """Test that an unknown app_id is a cache miss."""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+
+        assert cache.get(123456) is None
+        cache.close()
+
+    def test_set_then_get_round_trips_response(self, tmp_path):
+        """Test that a stored response is returned unchanged."""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        response = {"appid": 123456, "name": "Test Game", "tags": {"Action": 100}}
+
+        cache.set(123456, response)
+
+        assert cache.get(123456) == response
+        cache.close()
+
+    def test_responses_persist_across_instances(self, tmp_path):
+        """Test that closing the cache commits pending writes to disk."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = ResponseCache(path, commit_every=100)
+        cache.set(123456, {"appid": 123456})
+        cache.close()
+
+        reopened = ResponseCache(path)
+        assert reopened.get(123456) == {"appid": 123456}
+        reopened.close()
+
+    def test_expired_responses_are_ignored(self, tmp_path):
+        """Test that responses older than the TTL are treated as misses."""
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl_seconds=60)
+        cache.set(123456, {"appid": 123456})
+
+        with patch("utils.response_cache.time.time", return_value=time.time() + 61):
+            assert cache.get(123456) is None
+        cache.close()
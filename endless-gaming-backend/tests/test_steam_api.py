@@ -6,209 +6,173 @@ until the actual implementation is complete.
 """
 import pytest
 import json
-from unittest.mock import patch, MagicMock, AsyncMock
-from flask import Flask
+from urllib.parse import urlsplit, parse_qs
+from unittest.mock import patch, MagicMock
 import httpx
 
-from app import create_app
-from app.config import TestingConfig
+from app.steam.utils import validate_player_id
+
+
+OWNED_GAMES_PATH = "/IPlayerService/GetOwnedGames/v0001/"
+RESOLVE_VANITY_URL_PATH = "/ISteamUser/ResolveVanityURL/v0001/"
+
+# Steam API payloads served by the fake server; read-only, so shared by all tests
+OWNED_GAMES_RESPONSE = {
+    "response": {
+        "game_count": 2,
+        "games": [
+            {
+                "appid": 730,
+                "name": "Counter-Strike: Global Offensive",
+                "playtime_forever": 1000
+            },
+            {
+                "appid": 440,
+                "name": "Team Fortress 2",
+                "playtime_forever": 500
+            }
+        ]
+    }
+}
+
+OWNED_GAME_RESPONSE = {
+    "response": {
+        "game_count": 1,
+        "games": [
+            {
+                "appid": 730,
+                "name": "Counter-Strike: Global Offensive",
+                "playtime_forever": 1000
+            }
+        ]
+    }
+}
+
+OWNED_GAME_DETAILS_RESPONSE = {
+    "response": {
+        "game_count": 1,
+        "games": [
+            {
+                "appid": 730,
+                "name": "Counter-Strike: Global Offensive",
+                "playtime_forever": 1000,
+                "playtime_2weeks": 100,
+                "img_icon_url": "icon_url",
+                "img_logo_url": "logo_url"
+            }
+        ]
+    }
+}
+
+PRIVATE_PROFILE_RESPONSE = {
+    "response": {}
+}
+
+RESOLVE_VANITY_URL_RESPONSE = {
+    "response": {
+        "success": 1,
+        "steamid": "76561198000000000"
+    }
+}
+
+# Errors raised by the mocked Steam API; never mutated, so shared by all tests
+HTTP_403 = httpx.HTTPStatusError("HTTP Error", request=MagicMock(), response=MagicMock(status_code=403))
+TIMEOUT = httpx.TimeoutException("Timeout")
+
+
+def split_url(url):
+    """Split a requested URL into its path and parsed query parameters."""
+    parts = urlsplit(url)
+    return parts.path, parse_qs(parts.query)
+
+
+def raising(error):
+    """Coroutine function raising error, to stand in for an async method."""
+    async def fail(*args, **kwargs):
+        raise error
+    return fail
 
 
 class TestSteamAPIClient:
     """Test the Steam API client utility."""
 
-    @pytest.fixture
-    def steam_client(self):
-        """Create Steam API client for testing."""
-        from utils.steam_api_client import SteamAPIClient
-        return SteamAPIClient(api_key="test_key")
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_success(self, steam_client):
+    async def test_get_owned_games_success(self, steam_client, steam_server):
         """Test successful retrieval of owned games for a public profile."""
-        mock_response = {
-            "response": {
-                "game_count": 2,
-                "games": [
-                    {
-                        "appid": 730,
-                        "name": "Counter-Strike: Global Offensive",
-                        "playtime_forever": 1000,
-                        "img_icon_url": "icon_url",
-                        "img_logo_url": "logo_url"
-                    },
-                    {
-                        "appid": 440,
-                        "name": "Team Fortress 2", 
-                        "playtime_forever": 500,
-                        "img_icon_url": "icon_url2",
-                        "img_logo_url": "logo_url2"
-                    }
-                ]
-            }
-        }
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=OWNED_GAMES_RESPONSE)
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-            
-            result = await steam_client.get_owned_games("76561198000000000")
-            
-            assert result == mock_response
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args[0][0]
-            assert "IPlayerService/GetOwnedGames" in call_args
-            assert "key=test_key" in call_args
-            assert "steamid=76561198000000000" in call_args
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_private_profile(self, steam_client):
+        result = await steam_client.get_owned_games("76561198000000000")
+        
+        assert result == OWNED_GAMES_RESPONSE
+        assert len(steam_server.requested) == 1
+        path, query = split_url(steam_server.requested[0])
+        assert path == OWNED_GAMES_PATH
+        assert query["key"] == ["test_key"]
+        assert query["steamid"] == ["76561198000000000"]
+
+    async def test_get_owned_games_private_profile(self, steam_client, steam_server):
         """Test handling of private profiles (empty response)."""
-        mock_response = {
-            "response": {}
-        }
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=PRIVATE_PROFILE_RESPONSE)
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-            
-            result = await steam_client.get_owned_games("76561198000000001")
-            
-            assert result == mock_response
-            assert "games" not in result["response"]
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_with_details(self, steam_client):
-        """Test retrieving games with additional details."""
-        mock_response = {
-            "response": {
-                "game_count": 1,
-                "games": [
-                    {
-                        "appid": 730,
-                        "name": "Counter-Strike: Global Offensive",
-                        "playtime_forever": 1000,
-                        "playtime_2weeks": 100,
-                        "img_icon_url": "icon_url",
-                        "img_logo_url": "logo_url"
-                    }
-                ]
-            }
-        }
+        result = await steam_client.get_owned_games("76561198000000001")
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-            
-            result = await steam_client.get_owned_games(
-                "76561198000000000", 
-                include_appinfo=True,
-                include_played_free_games=True
-            )
-            
-            assert result == mock_response
-            call_args = mock_get.call_args[0][0]
-            assert "include_appinfo=1" in call_args
-            assert "include_played_free_games=1" in call_args
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_http_error(self, steam_client):
-        """Test handling of HTTP errors from Steam API."""
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.side_effect = httpx.HTTPStatusError(
-                "HTTP Error", 
-                request=MagicMock(), 
-                response=MagicMock(status_code=403)
-            )
-            
-            with pytest.raises(httpx.HTTPStatusError):
-                await steam_client.get_owned_games("76561198000000000")
+        assert result == PRIVATE_PROFILE_RESPONSE
+        assert "games" not in result["response"]
 
-    @pytest.mark.asyncio
-    async def test_get_owned_games_timeout_error(self, steam_client):
-        """Test handling of timeout errors."""
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Timeout")
-            
-            with pytest.raises(httpx.TimeoutException):
+    async def test_get_owned_games_with_details(self, steam_client, steam_server):
+        """Test retrieving games with additional details."""
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=OWNED_GAME_DETAILS_RESPONSE)
+        
+        result = await steam_client.get_owned_games(
+            "76561198000000000", 
+            include_appinfo=True,
+            include_played_free_games=True
+        )
+        
+        assert result == OWNED_GAME_DETAILS_RESPONSE
+        path, query = split_url(steam_server.requested[0])
+        assert query["include_appinfo"] == ["1"]
+        assert query["include_played_free_games"] == ["1"]
+
+    @pytest.mark.parametrize("error", [HTTP_403, TIMEOUT], ids=["http_error", "timeout"])
+    async def test_get_owned_games_error_propagates(self, steam_client, error):
+        """Test that HTTP and timeout errors from Steam API are raised to the caller."""
+        with patch.object(steam_client.http_client, 'get_with_retry', new=raising(error)):
+            with pytest.raises(type(error)):
                 await steam_client.get_owned_games("76561198000000000")
 
-    @pytest.mark.asyncio
-    async def test_resolve_vanity_url_success(self, steam_client):
+    async def test_resolve_vanity_url_success(self, steam_client, steam_server):
         """Test successful vanity URL resolution."""
-        mock_resolve_response = {
-            "response": {
-                "success": 1,
-                "steamid": "76561198000000000"
-            }
-        }
+        steam_server.routes[RESOLVE_VANITY_URL_PATH] = httpx.Response(200, json=RESOLVE_VANITY_URL_RESPONSE)
+        
+        result = await steam_client.resolve_vanity_url("gaben")
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_resolve_response
-            
-            result = await steam_client.resolve_vanity_url("gaben")
-            
-            assert result == "76561198000000000"
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args[0][0]
-            assert "ISteamUser/ResolveVanityURL" in call_args
-            assert "vanityurl=gaben" in call_args
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_with_vanity_name(self, steam_client):
+        assert result == "76561198000000000"
+        assert len(steam_server.requested) == 1
+        path, query = split_url(steam_server.requested[0])
+        assert path == RESOLVE_VANITY_URL_PATH
+        assert query["vanityurl"] == ["gaben"]
+
+    async def test_get_owned_games_with_vanity_name(self, steam_client, steam_server):
         """Test getting owned games using vanity name."""
-        mock_resolve_response = {
-            "response": {
-                "success": 1,
-                "steamid": "76561198000000000"
-            }
-        }
+        steam_server.routes[RESOLVE_VANITY_URL_PATH] = httpx.Response(200, json=RESOLVE_VANITY_URL_RESPONSE)
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=OWNED_GAME_RESPONSE)
         
-        mock_games_response = {
-            "response": {
-                "game_count": 1,
-                "games": [
-                    {
-                        "appid": 730,
-                        "name": "Counter-Strike: Global Offensive",
-                        "playtime_forever": 1000
-                    }
-                ]
-            }
-        }
+        result = await steam_client.get_owned_games("gaben")
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            # First call for resolve, second call for games
-            mock_get.side_effect = [mock_resolve_response, mock_games_response]
-            
-            result = await steam_client.get_owned_games("gaben")
-            
-            assert result == mock_games_response
-            assert mock_get.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_get_owned_games_with_steamid64(self, steam_client):
+        assert result == OWNED_GAME_RESPONSE
+        # First call for resolve, second call for games
+        assert len(steam_server.requested) == 2
+
+    async def test_get_owned_games_with_steamid64(self, steam_client, steam_server):
         """Test getting owned games using SteamID64 (no resolution needed)."""
-        mock_games_response = {
-            "response": {
-                "game_count": 1,
-                "games": [
-                    {
-                        "appid": 730,
-                        "name": "Counter-Strike: Global Offensive",
-                        "playtime_forever": 1000
-                    }
-                ]
-            }
-        }
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=OWNED_GAME_RESPONSE)
         
-        with patch.object(steam_client.http_client, 'get_with_retry', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_games_response
-            
-            result = await steam_client.get_owned_games("76561198000000000")
-            
-            assert result == mock_games_response
-            # Should only call once (no resolution needed)
-            assert mock_get.call_count == 1
-
-    @pytest.mark.asyncio
+        result = await steam_client.get_owned_games("76561198000000000")
+        
+        assert result == OWNED_GAME_RESPONSE
+        # Should only call once (no resolution needed)
+        assert len(steam_server.requested) == 1
+
     async def test_invalid_player_id_validation(self, steam_client):
         """Test validation of player ID format."""
         with pytest.raises(ValueError):
@@ -225,34 +189,34 @@ class TestSteamAPIClient:
 class TestSteamBlueprint:
     """Test the Steam API blueprint routes."""
 
-    @pytest.fixture
-    def client(self, db_engine):
-        """Create test client with test database."""
-        with patch.dict('os.environ', {'STEAM_API_KEY': 'test_key_123'}):
-            app = create_app('testing')
-            app.db_engine = db_engine
-            from sqlalchemy.orm import sessionmaker
-            app.db_session_factory = sessionmaker(bind=db_engine)
-            return app.test_client()
-
-    def test_steam_blueprint_registered(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def client(flask_app, steam_api_server):
+        """Create one test client for these tests, with its Steam API requests answered by steam_server."""
+        # Class-scoped so the config patch is undone once this class finishes
+        # and does not leak into other tests using the session-scoped flask_app
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setitem(flask_app.config, 'STEAM_API_KEY', 'test_key_123')
+            monkeypatch.setitem(flask_app.config, 'STEAM_API_TRANSPORT', httpx.MockTransport(steam_api_server.handle))
+            with flask_app.test_client() as client:
+                yield client
+
+    def test_steam_blueprint_registered(self, flask_app):
         """Test that steam blueprint is registered with the app."""
-        app = create_app('testing')
-        
         # Check that the blueprint is registered
-        blueprint_names = [bp.name for bp in app.blueprints.values()]
+        blueprint_names = [bp.name for bp in flask_app.blueprints.values()]
         assert 'steam' in blueprint_names
 
     def test_lookup_player_endpoint_exists(self, client):
         """Test that the lookup-player endpoint is accessible."""
         # Test that route exists (even if it returns an error initially)
-        response = client.get('/api/steam/lookup-player?player_id=76561198000000000')
+        response = client.get('/steam/lookup-player?player_id=76561198000000000')
         assert response is not None
         # Initially may return 500 due to missing implementation
 
     def test_lookup_player_missing_parameter(self, client):
         """Test that missing player_id parameter returns 400."""
-        response = client.get('/api/steam/lookup-player')
+        response = client.get('/steam/lookup-player')
         assert response.status_code == 400
         data = json.loads(response.data)
         assert 'error' in data
@@ -260,111 +224,51 @@ class TestSteamBlueprint:
 
     def test_lookup_player_invalid_parameter(self, client):
         """Test that invalid player_id parameter returns 400."""
-        response = client.get('/api/steam/lookup-player?player_id=invalid')
+        response = client.get('/steam/lookup-player?player_id=invalid_id!@')
         assert response.status_code == 400
         data = json.loads(response.data)
         assert 'error' in data
 
-    def test_lookup_player_success(self, client):
+    def test_lookup_player_success(self, client, steam_server):
         """Test successful player lookup."""
-        mock_steam_response = {
-            "response": {
-                "game_count": 2,
-                "games": [
-                    {
-                        "appid": 730,
-                        "name": "Counter-Strike: Global Offensive",
-                        "playtime_forever": 1000
-                    },
-                    {
-                        "appid": 440,
-                        "name": "Team Fortress 2",
-                        "playtime_forever": 500
-                    }
-                ]
-            }
-        }
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=OWNED_GAMES_RESPONSE)
+        
+        response = client.get('/steam/lookup-player?player_id=76561198000000000')
         
-        with patch('app.steam.blueprint.SteamAPIClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get_owned_games.return_value = mock_steam_response
-            mock_client_class.return_value = mock_client
-            
-            # Mock asyncio.run for the synchronous Flask context
-            with patch('asyncio.run') as mock_run:
-                mock_run.return_value = mock_steam_response
-                
-                response = client.get('/api/steam/lookup-player?player_id=76561198000000000')
-                
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data == mock_steam_response
-
-    def test_lookup_player_private_profile(self, client):
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        # The blueprint unwraps Steam's {"response": {...}} envelope
+        assert data == OWNED_GAMES_RESPONSE['response']
+
+    def test_lookup_player_private_profile(self, client, steam_server):
         """Test handling of private profiles."""
-        mock_steam_response = {
-            "response": {}
-        }
+        steam_server.routes[OWNED_GAMES_PATH] = httpx.Response(200, json=PRIVATE_PROFILE_RESPONSE)
+        
+        response = client.get('/steam/lookup-player?player_id=76561198000000001')
         
-        with patch('app.steam.blueprint.SteamAPIClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get_owned_games.return_value = mock_steam_response
-            mock_client_class.return_value = mock_client
-            
-            with patch('asyncio.run') as mock_run:
-                mock_run.return_value = mock_steam_response
-                
-                response = client.get('/api/steam/lookup-player?player_id=76561198000000001')
-                
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data == mock_steam_response
-
-    def test_lookup_player_steam_api_error(self, client):
-        """Test handling of Steam API errors."""
-        with patch('app.steam.blueprint.SteamAPIClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get_owned_games.side_effect = httpx.HTTPStatusError(
-                "HTTP Error",
-                request=MagicMock(),
-                response=MagicMock(status_code=403)
-            )
-            mock_client_class.return_value = mock_client
-            
-            with patch('asyncio.run') as mock_run:
-                mock_run.side_effect = httpx.HTTPStatusError(
-                    "HTTP Error",
-                    request=MagicMock(),
-                    response=MagicMock(status_code=403)
-                )
-                
-                response = client.get('/api/steam/lookup-player?player_id=76561198000000000')
-                
-                assert response.status_code == 503
-                data = json.loads(response.data)
-                assert 'error' in data
-
-    def test_lookup_player_timeout_error(self, client):
-        """Test handling of timeout errors."""
-        with patch('app.steam.blueprint.SteamAPIClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get_owned_games.side_effect = httpx.TimeoutException("Timeout")
-            mock_client_class.return_value = mock_client
-            
-            with patch('asyncio.run') as mock_run:
-                mock_run.side_effect = httpx.TimeoutException("Timeout")
-                
-                response = client.get('/api/steam/lookup-player?player_id=76561198000000000')
-                
-                assert response.status_code == 504
-                data = json.loads(response.data)
-                assert 'error' in data
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data == PRIVATE_PROFILE_RESPONSE['response']
+
+    @pytest.mark.parametrize("steam_response,expected_status", [
+        (httpx.Response(403), 503),
+        (TIMEOUT, 504),
+    ], ids=["steam_api_error", "timeout"])
+    def test_lookup_player_error(self, client, steam_server, instant_retries, steam_response, expected_status):
+        """Test that Steam API and timeout errors map to gateway status codes."""
+        steam_server.routes[OWNED_GAMES_PATH] = steam_response
+        
+        response = client.get('/steam/lookup-player?player_id=76561198000000000')
+        
+        assert response.status_code == expected_status
+        data = json.loads(response.data)
+        assert 'error' in data
 
     def test_lookup_player_missing_api_key(self, client):
         """Test handling when Steam API key is not configured."""
         # This will test configuration validation once implemented
         with patch.dict('os.environ', {}, clear=True):
-            response = client.get('/api/steam/lookup-player?player_id=76561198000000000')
+            response = client.get('/steam/lookup-player?player_id=76561198000000000')
             # Should return 500 for configuration error
             # Implementation will handle this appropriately
 
@@ -374,13 +278,10 @@ class TestSteamAPIConfiguration:
 
     def test_steam_api_key_from_environment(self):
         """Test that Steam API key is loaded from environment."""
-        import importlib
-        import app.config
+        from app.config import DevelopmentConfig
         
         with patch.dict('os.environ', {'STEAM_API_KEY': 'test_key_123'}):
-            # Reload the config module to pick up the env var
-            importlib.reload(app.config)
-            config = app.config.DevelopmentConfig()
+            config = DevelopmentConfig()
             assert hasattr(config, 'STEAM_API_KEY')
             assert config.STEAM_API_KEY == 'test_key_123'
 
@@ -402,32 +303,26 @@ class TestSteamAPIConfiguration:
 class TestPlayerIDValidation:
     """Test Steam player ID validation utilities."""
 
-    def test_valid_player_id_formats(self):
-        """Test validation of various player ID formats."""
-        from app.steam.utils import validate_player_id
-        
+    @pytest.mark.parametrize("player_id,expected", [
         # Valid SteamID64 format
-        assert validate_player_id("76561198000000000") is True
-        
+        ("76561198000000000", True),
         # Valid vanity names
-        assert validate_player_id("gaben") is True
-        assert validate_player_id("user123") is True
-        assert validate_player_id("player_name") is True
-        assert validate_player_id("user-name") is True
-        
+        ("gaben", True),
+        ("user123", True),
+        ("player_name", True),
+        ("user-name", True),
         # Valid URLs
-        assert validate_player_id("https://steamcommunity.com/id/gaben") is True
-        assert validate_player_id("/id/gaben") is True
-
-    def test_invalid_player_id_formats(self):
-        """Test rejection of invalid player ID formats."""
-        from app.steam.utils import validate_player_id
-        
+        ("https://steamcommunity.com/id/gaben", True),
+        ("/id/gaben", True),
         # Various invalid formats
-        assert validate_player_id("invalid!@#") is False
-        assert validate_player_id("") is False
-        assert validate_player_id(None) is False
-        assert validate_player_id("user name") is False  # Spaces not allowed
+        ("invalid!@#", False),
+        ("", False),
+        (None, False),
+        ("user name", False),  # Spaces not allowed
+    ])
+    def test_player_id_formats(self, player_id, expected):
+        """Test validation of various player ID formats."""
+        assert validate_player_id(player_id) is expected
 
     def test_steam_id_conversion(self):
         """Test conversion between different Steam ID formats if implemented."""
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import json
 from unittest.mock import Mock, patch, AsyncMock
@@ -9,6 +10,15 @@ from models.game import Game
 from models.storefront_data import StorefrontData
 from models.game_metadata import FetchStatus
 from utils.rate_limiter import APIEndpoint
+from utils.response_cache import ResponseCache
+
+
+@pytest.fixture
+def storefront_cache(tmp_path):
+    """Create an on-disk appdetails cache that is closed after the test."""
+    cache = ResponseCache(str(tmp_path / "storefront.sqlite"))
+    yield cache
+    cache.close()
 
 
 class TestSteamStoreCollector:
@@ -116,6 +126,26 @@ class TestSteamStoreCollector:
             assert result.fetch_status == FetchStatus.FAILED.value
             assert result.fetch_attempts == 1
 
+    async def test_fetch_storefront_data_uses_cache(self, storefront_cache):
+        """Test that a cached appdetails response is reused instead of re-requested."""
+        collector = SteamStoreCollector(storefront_cache=storefront_cache)
+        
+        mock_response_data = {
+            "123456": {
+                "success": True,
+                "data": {"short_description": "A test game description"}
+            }
+        }
+        
+        with patch.object(collector.rate_limiter, 'make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response_data
+            
+            first = await collector.fetch_storefront_data(123456)
+            second = await collector.fetch_storefront_data(123456)
+            
+            mock_request.assert_called_once()
+            assert first.short_description == second.short_description == "A test game description"
+
     def test_parse_steam_store_data_complete(self):
         """Test parsing complete Steam Store API data."""
         collector = SteamStoreCollector()
@@ -287,6 +317,39 @@ class TestSteamStoreCollector:
             assert progress_calls[1] == (2, 3, "Test Game 1", FetchStatus.SUCCESS.value)
             assert progress_calls[2] == (3, 3, "Test Game 2", FetchStatus.SUCCESS.value)
     
+    async def test_collect_storefront_data_for_games_stops_fetches_on_error(self, db_session, sample_game_data):
+        """Test that a failure part-way through leaves no storefront fetches running."""
+        collector = SteamStoreCollector()
+        
+        games = []
+        for i in range(3):
+            game_data = sample_game_data.copy()
+            game_data['app_id'] = 123456 + i
+            game_data['name'] = f"Test Game {i}"
+            game = Game(**game_data)
+            games.append(game)
+            db_session.add(game)
+        db_session.commit()
+        
+        never_set = asyncio.Event()
+        
+        async def mock_fetch_data(app_id):
+            # Only the first game's fetch finishes; the others wait forever
+            if app_id != 123456:
+                await never_set.wait()
+            return StorefrontData(app_id=app_id, fetch_status=FetchStatus.SUCCESS.value)
+        
+        def failing_progress_callback(current, total, game_name, status):
+            raise RuntimeError("progress display failed")
+        
+        with patch.object(collector, 'fetch_storefront_data', side_effect=mock_fetch_data):
+            with pytest.raises(RuntimeError, match="progress display failed"):
+                await collector.collect_storefront_data_for_games(
+                    games, db_session, progress_callback=failing_progress_callback
+                )
+        
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+    
     def test_parse_steam_store_data_with_media(self):
         """Test parsing Steam Store data with screenshots and movies."""
         collector = SteamStoreCollector()
@@ -3,10 +3,12 @@ Tests for SteamSpy All collector functionality.
 """
 import asyncio
 import pytest
+from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from collectors.steamspy_all_collector import SteamSpyAllCollector
+from collectors.steamspy_all_collector import SteamSpyAllCollector, UPSERT_CHUNK_SIZE
 from models.game import Game
 from utils.rate_limiter import SimpleRateLimiter, APIEndpoint
 
@@ -201,6 +203,20 @@ class TestSteamSpyAllCollector:
         updated_game = db_session.query(Game).filter(Game.app_id == 1).first()
         assert updated_game.name == "New Name"
     
+    async def test_save_games_to_database_duplicate_app_ids(self, db_session):
+        """Test that a game repeated within one batch is saved once, with its last name."""
+        collector = SteamSpyAllCollector()
+        
+        games = [Game(app_id=1, name="First Name"), Game(app_id=1, name="Last Name")]
+        
+        result = await collector.save_games_to_database(games, db_session)
+        
+        assert result['new_games'] == 1
+        assert result['updated_games'] == 0
+        
+        saved_games = db_session.query(Game).all()
+        assert [game.name for game in saved_games] == ["Last Name"]
+    
     @pytest.mark.asyncio 
     async def test_save_games_to_database_deactivate_missing(self, db_session):
         """Test deactivating games not in current response."""
@@ -225,6 +241,32 @@ class TestSteamSpyAllCollector:
         game2_updated = db_session.query(Game).filter(Game.app_id == 2).first()
         assert game2_updated.is_active == False
     
+    async def test_save_games_to_database_deactivates_without_binding_app_ids(self, db_session, sql_statements):
+        """Test that deactivation over more than one chunk of games doesn't list every app_id."""
+        collector = SteamSpyAllCollector()
+        
+        last_run = datetime(2020, 1, 1)
+        db_session.add_all([
+            Game(app_id=1, name="Game 1", is_active=True, updated_at=last_run),
+            Game(app_id=2, name="Game 2", is_active=True, updated_at=last_run),
+        ])
+        db_session.commit()
+        
+        # Game 1 plus more games than one upsert chunk; game 2 is missing
+        app_ids = [1, *range(1000, 1000 + UPSERT_CHUNK_SIZE + 1)]
+        games = [Game(app_id=app_id, name=f"Game {app_id}") for app_id in app_ids]
+        
+        sql_statements.clear()
+        result = await collector.save_games_to_database(games, db_session, deactivate_missing=True)
+        
+        assert result['deactivated_games'] == 1
+        active = dict(db_session.execute(select(Game.app_id, Game.is_active).where(Game.app_id.in_([1, 2]))).all())
+        assert active == {1: True, 2: False}
+        
+        updates = [s for s in sql_statements if s.lstrip().upper().startswith('UPDATE')]
+        assert len(updates) == 1
+        assert 'NOT IN' not in updates[0].upper()
+    
     @pytest.mark.asyncio
     async def test_collect_and_save_games_single_page(self, db_session):
         """Test complete collection workflow for single page."""
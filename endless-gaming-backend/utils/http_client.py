@@ -4,16 +4,48 @@ HTTP client with retry logic and timeout handling.
 import asyncio
 from typing import Dict, Any, Optional
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
+
+
+# Keep every pooled connection alive between requests. httpx's default keeps
+# only 20 idle connections for 5 seconds, so batches of concurrent requests
+# (and the 1/minute SteamSpy /all calls) kept paying for new TCP/TLS handshakes.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=90.0
+)
+
+# Back-off before the first retry of get_with_retry; doubles after each
+# further failure, up to MAX_RETRY_DELAY
+RETRY_BASE_DELAY = 1.0
+MAX_RETRY_DELAY = 10.0
 
 
 class HTTPClient:
     """HTTP client with built-in retry logic and proper error handling."""
     
-    def __init__(self, timeout: float = 30.0):
-        """Initialize HTTP client with timeout configuration."""
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize HTTP client with timeout and connection pool configuration.
+        
+        Args:
+            timeout: Request timeout in seconds
+            limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+            transport: Transport to send requests through instead of the
+                network (e.g. httpx.MockTransport in tests)
+        """
         self.timeout = timeout
-        self.session = httpx.AsyncClient(timeout=timeout)
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits or DEFAULT_LIMITS,
+            transport=transport
+        )
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -23,11 +55,6 @@ class HTTPClient:
         """Async context manager exit."""
         await self.session.aclose()
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, asyncio.TimeoutError))
-    )
     async def get_with_retry(
         self, 
         url: str, 
@@ -37,9 +64,13 @@ class HTTPClient:
         """
         Make GET request with retry logic.
         
+        HTTP errors and timeouts are retried with exponential back-off; a
+        plain loop rather than a retry decorator keeps the successful path,
+        which is nearly every call, free of retry bookkeeping.
+        
         Args:
             url: URL to request
-            max_retries: Maximum number of retries (for test compatibility)
+            max_retries: Maximum number of attempts
             **kwargs: Additional arguments passed to httpx.get
             
         Returns:
@@ -49,9 +80,20 @@ class HTTPClient:
             httpx.HTTPError: On HTTP errors after retries
             asyncio.TimeoutError: On timeout after retries
         """
-        response = await self.session.get(url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        attempts = max(max_retries, 1)
+        delay = RETRY_BASE_DELAY
+        for attempt in range(attempts):
+            try:
+                response = await self.session.get(url, **kwargs)
+                response.raise_for_status()
+                # Parse the raw bytes with orjson; it is several times faster than
+                # response.json() on the large SteamSpy and appdetails payloads
+                return orjson.loads(response.content)
+            except (httpx.HTTPError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(min(delay, MAX_RETRY_DELAY))
+                delay *= 2
     
     async def close(self):
         """Close the HTTP session."""
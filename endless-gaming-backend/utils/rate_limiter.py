@@ -6,10 +6,15 @@ import time
 from enum import Enum
 from typing import Dict, Any, Optional
 import httpx
+import orjson
 from aiolimiter import AsyncLimiter
 from utils.http_client import HTTPClient
 
 
+# Seconds to wait before make_request retries a failed request
+RETRY_DELAY = 1.0
+
+
 class APIEndpoint(Enum):
     """Enumeration of supported API endpoints with their identifiers."""
     STEAM_WEB_API = "steam_web_api"
@@ -19,6 +24,70 @@ class APIEndpoint(Enum):
     STEAMSPY_ALL_API = "steamspy_all_api"
 
 
+def is_rate_limited(error: BaseException) -> bool:
+    """
+    Check whether an error is an HTTP 429 Too Many Requests response.
+    
+    Args:
+        error: Exception raised by a request
+        
+    Returns:
+        True if the server rejected the request for exceeding its rate limit
+    """
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that adapts to server rate limiting (AIMD).
+    
+    Used as an async context manager around each unit of work. The limit is
+    halved whenever the server answers 429 and grows by one after a run of
+    successful requests, up to the starting limit, so request concurrency
+    settles near what the server will actually accept.
+    """
+    
+    def __init__(self, max_limit: int, grow_after: int = 32):
+        """
+        Initialize the concurrency limit.
+        
+        Args:
+            max_limit: Starting and maximum number of concurrent units of work
+            grow_after: Consecutive successes needed to raise the limit by one
+        """
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.grow_after = grow_after
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        """Wait until the number of units in flight is below the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the slot and wake waiters, which also picks up a raised limit."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+    
+    def record_success(self) -> None:
+        """Count a successful request, growing the limit after enough in a row."""
+        self._successes += 1
+        if self._successes >= self.grow_after:
+            self._successes = 0
+            self.limit = min(self.max_limit, self.limit + 1)
+    
+    def record_rate_limited(self) -> None:
+        """Halve the limit after the server rejected a request with 429."""
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+
+
 class SimpleRateLimiter:
     """
     Multi-API rate limiter that blocks requests when limits are exceeded.
@@ -28,8 +97,14 @@ class SimpleRateLimiter:
     API limits.
     """
     
-    def __init__(self):
-        """Initialize rate limiter with endpoint-specific limits."""
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize rate limiter with endpoint-specific limits.
+        
+        Args:
+            http_client: Shared HTTP client to send requests through (a new one
+                is created if not provided)
+        """
         # Configure rate limiters per endpoint using aiolimiter
         self.limiters = {
             APIEndpoint.STEAM_WEB_API: AsyncLimiter(100000, 86400),  # 100k/day
@@ -39,8 +114,8 @@ class SimpleRateLimiter:
             APIEndpoint.STEAMSPY_ALL_API: AsyncLimiter(1, 60),       # 1/minute
         }
         
-        # HTTP client for making requests
-        self.http_client = HTTPClient()
+        # HTTP client for making requests; one pooled client serves every endpoint
+        self.http_client = http_client or HTTPClient()
     
     def get_limit(self, endpoint: APIEndpoint) -> str:
         """
@@ -125,17 +200,18 @@ class SimpleRateLimiter:
         # Apply rate limiting first
         await self._async_throttle(endpoint)
         
-        # Make the HTTP request with retries
+        # Make the HTTP request with retries; SteamSpy /all pages are ~1 MB of
+        # JSON, so parse the raw bytes with orjson rather than response.json()
         try:
             response = await self.http_client.session.get(url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             # Retry once on HTTP errors
-            await asyncio.sleep(1)
+            await asyncio.sleep(RETRY_DELAY)
             response = await self.http_client.session.get(url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
     
     async def close(self):
         """Close HTTP client and clean up resources."""
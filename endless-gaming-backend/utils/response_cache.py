@@ -0,0 +1,85 @@
+"""
+On-disk cache for API responses keyed by Steam app ID.
+"""
+import sqlite3
+import time
+from typing import Dict, Any, Optional
+
+import orjson
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of JSON API responses with a time-to-live.
+
+    Lets repeated collection runs reuse responses from rate-limited APIs
+    instead of fetching every game again. Writes are committed in batches
+    to avoid an fsync per response.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 7 * 86400, commit_every: int = 64):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: Age after which cached responses are ignored
+            commit_every: Number of writes between commits
+        """
+        self.ttl_seconds = ttl_seconds
+        self.commit_every = commit_every
+        self._pending_writes = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(app_id INTEGER PRIMARY KEY, fetched_at INTEGER NOT NULL, body BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get(self, app_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response if present and not expired.
+
+        Args:
+            app_id: Steam application ID
+
+        Returns:
+            Cached response dict or None on a miss
+        """
+        row = self._connection.execute(
+            "SELECT body, fetched_at FROM responses WHERE app_id = ?", (app_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, fetched_at = row
+        if time.time() - fetched_at >= self.ttl_seconds:
+            return None
+
+        return orjson.loads(body)
+
+    def set(self, app_id: int, response: Dict[str, Any]) -> None:
+        """
+        Store a response, replacing any previous entry for the app.
+
+        Args:
+            app_id: Steam application ID
+            response: Response dict to cache
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (app_id, fetched_at, body) VALUES (?, ?, ?)",
+            (app_id, int(time.time()), orjson.dumps(response))
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        """Commit pending writes to disk."""
+        self._connection.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._connection.close()
@@ -6,19 +6,37 @@ Provides methods for retrieving player information and game data from Steam.
 import re
 from typing import Dict, Any, Optional
 from urllib.parse import urlencode
+import httpx
 from utils.http_client import HTTPClient
 
 
+# SteamID64 format: 17-digit number starting with 76561198
+STEAM_ID64_PATTERN = re.compile(r'^76561198\d{9}$')
+
+# Vanity name: letters, numbers, underscores, hyphens
+VANITY_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Vanity name in URLs like https://steamcommunity.com/id/vanityname or /id/vanityname/
+PROFILE_URL_VANITY_PATTERN = re.compile(r'/id/([^/]+)')
+
+
 class SteamAPIClient:
     """Client for Steam Web API with built-in retry logic and error handling."""
     
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.steampowered.com"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.steampowered.com",
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """
         Initialize Steam API client.
         
         Args:
             api_key: Steam Web API key
             base_url: Base URL for Steam API
+            transport: Transport to send requests through instead of the
+                network (e.g. httpx.MockTransport in tests)
             
         Raises:
             ValueError: If api_key is not provided
@@ -28,7 +46,7 @@ class SteamAPIClient:
         
         self.api_key = api_key
         self.base_url = base_url
-        self.http_client = HTTPClient(timeout=30.0)
+        self.http_client = HTTPClient(timeout=30.0, transport=transport)
     
     def _validate_steam_id(self, steam_id: str) -> bool:
         """
@@ -43,9 +61,7 @@ class SteamAPIClient:
         if not steam_id or not isinstance(steam_id, str):
             return False
         
-        # SteamID64 format: 17-digit number starting with 76561198
-        pattern = r'^76561198\d{9}$'
-        return bool(re.match(pattern, steam_id))
+        return bool(STEAM_ID64_PATTERN.match(steam_id))
     
     def _detect_player_id_type(self, player_id: str) -> str:
         """
@@ -61,15 +77,15 @@ class SteamAPIClient:
             return 'unknown'
         
         # SteamID64 format
-        if re.match(r'^76561198\d{9}$', player_id):
+        if STEAM_ID64_PATTERN.match(player_id):
             return 'steamid64'
         
         # Full Steam profile URL or partial path
         if 'steamcommunity.com/id/' in player_id or player_id.startswith('/id/'):
             return 'url'
         
-        # Assume it's a vanity name (letters, numbers, underscores, hyphens)
-        if re.match(r'^[a-zA-Z0-9_-]+$', player_id):
+        # Assume it's a vanity name
+        if VANITY_NAME_PATTERN.match(player_id):
             return 'vanity'
         
         return 'unknown'
@@ -84,8 +100,7 @@ class SteamAPIClient:
         Returns:
             Vanity name or original string if not a URL
         """
-        # Extract from URLs like https://steamcommunity.com/id/vanityname or /id/vanityname/
-        match = re.search(r'/id/([^/]+)', url)
+        match = PROFILE_URL_VANITY_PATTERN.search(url)
         if match:
             return match.group(1)
         return url